@@ -0,0 +1,24 @@
+"""Shared HTTP session for the web services queried during identification."""
+
+from __future__ import annotations
+
+import functools
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Matches ``config.MAX_IDENTIFY_BATCH_WORKERS`` so each identify-batch worker keeps a connection.
+POOL_SIZE = 16
+
+
+@functools.cache
+def shared_session() -> requests.Session:
+    """Return the process-wide session so keep-alive connections survive across lookups."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+__all__ = ["POOL_SIZE", "shared_session"]
@@ -14,10 +14,9 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
-import numpy as np
 import requests
-import soundfile
 
+from ._http import shared_session
 from .fingerprint import AcoustIDMatch, ReleaseInfo
 from .i18n import _
 
@@ -196,7 +195,7 @@ def recognize_with_audd(
                     # Request common catalog identifiers to enrich results if available.
                     "return": _AUDD_RETURN_FIELDS,
                 }
-                response = requests.post(endpoint, data=data, files=files, timeout=timeout)
+                response = shared_session().post(endpoint, data=data, files=files, timeout=timeout)
         except requests.RequestException as exc:  # pragma: no cover - network failures
             message = _redact_audd_token(_("AudD request failed: {error}").format(error=exc))
             raise AudDLookupError(message) from exc
@@ -267,7 +266,7 @@ def _recognize_with_enterprise(
     try:
         with audio_path.open("rb") as handle:
             files = {"file": (audio_path.name, handle, "application/octet-stream")}
-            response = requests.post(endpoint, data=data, files=files, timeout=timeout)
+            response = shared_session().post(endpoint, data=data, files=files, timeout=timeout)
     except requests.RequestException as exc:  # pragma: no cover - network failures
         message = _redact_audd_token(_("AudD request failed: {error}").format(error=exc))
         raise AudDLookupError(message) from exc
@@ -611,6 +610,9 @@ def _render_snippet_with_soundfile(
     snippet_offset: float,
 ) -> None:
     """Try to render the AudD snippet via libsndfile/librosa."""
+    import numpy as np
+    import soundfile
+
     try:
         import librosa
     except Exception as exc:  # pragma: no cover - dependency missing
@@ -738,6 +740,9 @@ def _render_snippet_with_ffmpeg(
 
 def _analyse_snippet(snippet_path: Path) -> tuple[float, float]:
     """Read the rendered snippet and compute duration/RMS metrics."""
+    import numpy as np
+    import soundfile
+
     try:
         samples, rate = soundfile.read(snippet_path, dtype="float32")
     except Exception as exc:  # pragma: no cover - defensive path
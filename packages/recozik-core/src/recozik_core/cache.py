@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import timedelta
@@ -11,9 +14,11 @@ from pathlib import Path
 
 import platformdirs
 
+from . import json_codec
 from .fingerprint import AcoustIDMatch
 
 CACHE_FILENAME = "lookup-cache.json"
+DEFAULT_MAX_ENTRIES = 10_000
 
 
 def default_cache_path() -> Path:
@@ -52,7 +57,11 @@ class CacheEntry:
 
 
 class LookupCache:
-    """Lightweight JSON-backed cache for AcoustID lookups."""
+    """Lightweight JSON-backed LRU cache for AcoustID lookups.
+
+    Entries are kept in least-recently-used order and the oldest ones are evicted once
+    ``max_entries`` is exceeded, so the cache file stays bounded on large libraries.
+    """
 
     def __init__(
         self,
@@ -60,48 +69,78 @@ class LookupCache:
         *,
         enabled: bool = True,
         ttl: timedelta = timedelta(hours=24),
+        max_entries: int = DEFAULT_MAX_ENTRIES,
     ) -> None:
-        """Initialize the cache with desired file location and time-to-live."""
+        """Initialize the cache with desired file location, time-to-live, and size bound."""
         self.path = path or default_cache_path()
         self.enabled = enabled
         self.ttl = ttl
+        self.max_entries = max(max_entries, 1)
         self._loaded = False
-        self._data: dict[str, CacheEntry] = {}
+        self._data: OrderedDict[str, CacheEntry] = OrderedDict()
         self._dirty = False
+        self._lock = threading.Lock()
 
     def _ensure_loaded(self) -> None:
         if self._loaded or not self.enabled:
             return
         if self.path.exists():
             try:
-                payload = json.loads(self.path.read_text(encoding="utf-8"))
+                payload = json_codec.loads(self.path.read_bytes())
             except (OSError, json.JSONDecodeError):
                 payload = {}
-            for key, entry in payload.items():
+            now = time.time()
+            for stored_key, entry in payload.items():
                 try:
-                    self._data[key] = CacheEntry.from_dict(entry)
+                    cache_entry = CacheEntry.from_dict(entry)
                 except (KeyError, ValueError, TypeError):
                     continue
+                if self._is_expired(cache_entry, now):
+                    self._dirty = True
+                    continue
+                # Re-derive keys so files written with another key scheme still hit.
+                key = self._key(cache_entry.fingerprint, cache_entry.duration_seconds)
+                if key != stored_key:
+                    self._dirty = True
+                self._data[key] = cache_entry
+            self._evict()
         self._loaded = True
 
+    def _is_expired(self, entry: CacheEntry, now: float) -> bool:
+        return now - entry.timestamp > self.ttl.total_seconds()
+
+    def _evict(self) -> None:
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self._dirty = True
+
     @staticmethod
     def _key(fingerprint: str, duration_seconds: float) -> str:
+        # Chromaprint fingerprints run to several kilobytes; key on a 128-bit digest
+        # instead of duplicating the full string (it is already kept on the entry).
+        digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16)
         rounded: int = round(duration_seconds)
-        return f"{fingerprint}:{rounded}"
+        return f"{digest.hexdigest()}:{rounded}"
 
     def get(self, fingerprint: str, duration_seconds: float) -> list[AcoustIDMatch] | None:
         """Return cached matches matching the fingerprint and duration if fresh."""
         if not self.enabled:
             return None
-        self._ensure_loaded()
         key = self._key(fingerprint, duration_seconds)
-        entry = self._data.get(key)
-        if not entry:
-            return None
-        now = time.time()
-        if now - entry.timestamp > self.ttl.total_seconds():
-            return None
-        return entry.matches
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._data.get(key)
+            if not entry:
+                return None
+            if self._is_expired(entry, time.time()):
+                del self._data[key]
+                self._dirty = True
+                return None
+            if next(reversed(self._data)) != key:
+                # Persist the new recency order so eviction survives a reload.
+                self._data.move_to_end(key)
+                self._dirty = True
+            return entry.matches
 
     def set(
         self,
@@ -112,34 +151,44 @@ class LookupCache:
         """Store new matches for the given fingerprint and duration."""
         if not self.enabled:
             return
-        self._ensure_loaded()
         key = self._key(fingerprint, duration_seconds)
-        self._data[key] = CacheEntry(
+        entry = CacheEntry(
             fingerprint=fingerprint,
             duration_seconds=duration_seconds,
             timestamp=time.time(),
             matches=list(matches),
         )
-        self._dirty = True
+        with self._lock:
+            self._ensure_loaded()
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            self._evict()
+            self._dirty = True
 
     def clear(self) -> None:
         """Remove all cached entries and delete the cache file if present."""
-        self._data.clear()
-        self._dirty = True
-        if self.path.exists():
-            try:
-                self.path.unlink()
-            except OSError:
-                pass
+        with self._lock:
+            self._data.clear()
+            self._dirty = True
+            if self.path.exists():
+                try:
+                    self.path.unlink()
+                except OSError:
+                    pass
 
     def save(self) -> None:
         """Persist the in-memory cache to disk when it has been modified."""
-        if not self.enabled or not self._dirty:
+        if not self.enabled:
             return
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {key: entry.to_dict() for key, entry in self._data.items()}
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        self._dirty = False
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {key: entry.to_dict() for key, entry in self._data.items()}
+            self.path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            self._dirty = False
 
 
 __all__ = ["LookupCache", "default_cache_path"]
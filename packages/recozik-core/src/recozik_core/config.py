@@ -27,6 +27,7 @@ except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
 CONFIG_ENV_VAR = "RECOZIK_CONFIG_FILE"
 CONFIG_DIR_NAME = "recozik"
 CONFIG_FILE_NAME = "config.toml"
+MAX_IDENTIFY_BATCH_WORKERS = 16
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -101,6 +102,7 @@ class AppConfig:
     identify_batch_audd_enabled: bool = True
     identify_batch_audd_prefer: bool = False
     identify_batch_announce_source: bool = True
+    identify_batch_workers: int = 1
 
     def to_toml_dict(self) -> dict:
         """Return the configuration as a nested dictionary consumable by TOML writers."""
@@ -170,6 +172,7 @@ class AppConfig:
                 "audd_enabled": self.identify_batch_audd_enabled,
                 "prefer_audd": self.identify_batch_audd_prefer,
                 "announce_source": self.identify_batch_announce_source,
+                "workers": max(int(self.identify_batch_workers), 1),
             },
             "rename": {
                 "log_cleanup": cleanup_mode,
@@ -558,6 +561,17 @@ def load_config(path: Path | None = None) -> AppConfig:
         identify_batch_announce_value = identify_batch_announce_raw
     else:
         raise RuntimeError(_("The field identify_batch.announce_source must be a boolean."))
+    identify_batch_workers_value = identify_batch_section.get("workers", 1)
+    if isinstance(identify_batch_workers_value, bool) or not isinstance(
+        identify_batch_workers_value, int
+    ):
+        raise RuntimeError(_("The field identify_batch.workers must be an integer."))
+    if not 1 <= identify_batch_workers_value <= MAX_IDENTIFY_BATCH_WORKERS:
+        raise RuntimeError(
+            _("The field identify_batch.workers must be between 1 and {maximum}.").format(
+                maximum=MAX_IDENTIFY_BATCH_WORKERS
+            )
+        )
     identify_batch_log_file_value = identify_batch_section.get("log_file")
     if identify_batch_log_file_value is not None and not isinstance(
         identify_batch_log_file_value, str
@@ -617,6 +631,7 @@ def load_config(path: Path | None = None) -> AppConfig:
         identify_batch_audd_enabled=identify_batch_audd_enabled_value,
         identify_batch_audd_prefer=identify_batch_prefer_value,
         identify_batch_announce_source=identify_batch_announce_value,
+        identify_batch_workers=identify_batch_workers_value,
     )
     stored_acoustid = secret_store.get_acoustid_api_key()
     stored_audd = secret_store.get_audd_api_token()
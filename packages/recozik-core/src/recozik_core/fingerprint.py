@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Sequence
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TypeGuard
 
 try:
     import acoustid as pyacoustid
@@ -21,6 +24,42 @@ _FPCALC_ERRORS: tuple[type[Exception], ...] = tuple(
     if isinstance(exc, type)
 )
 
+# identify-batch fingerprints files from several threads (fpcalc runs as a subprocess,
+# so it does not hold the GIL); the ``FPCALC`` override is shared process state, so
+# concurrent calls may share one override but never switch it under each other.
+_FPCALC_ENV_LOCK = threading.Lock()
+_fpcalc_env_users = 0
+_fpcalc_env_value: str | None = None
+_fpcalc_env_previous: str | None = None
+
+
+@contextmanager
+def _fpcalc_override(env_var: str, value: str) -> Iterator[None]:
+    """Point pyacoustid at ``value`` while any thread is fingerprinting with it."""
+    global _fpcalc_env_users, _fpcalc_env_value, _fpcalc_env_previous
+    with _FPCALC_ENV_LOCK:
+        if _fpcalc_env_users == 0:
+            _fpcalc_env_previous = os.environ.get(env_var)
+            _fpcalc_env_value = value
+            os.environ[env_var] = value
+        elif value != _fpcalc_env_value:
+            raise FingerprintError(
+                f"fpcalc est déjà utilisé depuis {_fpcalc_env_value} par un autre calcul; "
+                f"impossible de basculer vers {value} en parallèle."
+            )
+        _fpcalc_env_users += 1
+    try:
+        yield
+    finally:
+        with _FPCALC_ENV_LOCK:
+            _fpcalc_env_users -= 1
+            if _fpcalc_env_users == 0:
+                _fpcalc_env_value = None
+                if _fpcalc_env_previous is None:
+                    os.environ.pop(env_var, None)
+                else:
+                    os.environ[env_var] = _fpcalc_env_previous
+
 
 @dataclass(slots=True)
 class FingerprintResult:
@@ -133,16 +172,15 @@ def compute_fingerprint(
 
     fpcalc_override = str(fpcalc_path) if fpcalc_path else None
     env_var = getattr(pyacoustid, "FPCALC_ENVVAR", "FPCALC")
-    previous_fpcalc = None
-
-    if fpcalc_override:
-        previous_fpcalc = os.environ.get(env_var)
-        os.environ[env_var] = fpcalc_override
 
     try:
-        raw_first, raw_second = pyacoustid.fingerprint_file(
-            str(audio_path), force_fpcalc=bool(fpcalc_override)
-        )
+        if fpcalc_override:
+            with _fpcalc_override(env_var, fpcalc_override):
+                raw_first, raw_second = pyacoustid.fingerprint_file(
+                    str(audio_path), force_fpcalc=True
+                )
+        else:
+            raw_first, raw_second = pyacoustid.fingerprint_file(str(audio_path), force_fpcalc=False)
         fingerprint, duration = _normalize_fingerprint_output(raw_first, raw_second)
     except Exception as exc:  # pragma: no cover - pyacoustid utilise divers types d'exceptions
         if _FPCALC_ERRORS and isinstance(exc, _FPCALC_ERRORS):  # type: ignore[arg-type]
@@ -151,16 +189,22 @@ def compute_fingerprint(
                 "Installez-le ou précisez --fpcalc-path."
             ) from exc
         raise FingerprintError(f"Échec du calcul d'empreinte: {exc}") from exc
-    finally:
-        if fpcalc_override:
-            if previous_fpcalc is None:
-                os.environ.pop(env_var, None)
-            else:
-                os.environ[env_var] = previous_fpcalc
 
     return FingerprintResult(fingerprint=fingerprint, duration_seconds=float(duration))
 
 
+def _is_number(value: object) -> TypeGuard[int | float]:
+    """Return ``True`` for ints and floats, checking the exact built-in types first."""
+    value_type = type(value)
+    return value_type is float or value_type is int or isinstance(value, (int, float))
+
+
+def _ensure_str(value: object) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
 def _normalize_fingerprint_output(
     raw_first: object,
     raw_second: object,
@@ -170,16 +214,10 @@ def _normalize_fingerprint_output(
     Recent ``acoustid`` releases return ``(duration, fingerprint)`` while older ones
     returned ``(fingerprint, duration)``.
     """
-
-    def _ensure_str(value: object) -> str:
-        if isinstance(value, bytes):
-            return value.decode("utf-8")
-        return str(value)
-
-    if isinstance(raw_first, (int, float)):
+    if _is_number(raw_first):
         duration = float(raw_first)
         fingerprint = _ensure_str(raw_second)
-    elif isinstance(raw_second, (int, float)):
+    elif _is_number(raw_second):
         fingerprint = _ensure_str(raw_first)
         duration = float(raw_second)
     else:
@@ -0,0 +1,46 @@
+"""JSON helpers that use :mod:`orjson` when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode ``data`` with orjson when available, falling back to :mod:`json`.
+
+    ``orjson`` rejects a few inputs the standard library accepts (``NaN``, integers
+    wider than 64 bits), so such payloads are retried with :func:`json.loads`.
+    Decoding errors are always reported as :class:`json.JSONDecodeError`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as single-line, non-ASCII-escaped JSON, using orjson when available.
+
+    orjson output is compact; without it, :func:`json.dumps` keeps its default
+    separators. Objects orjson cannot serialize (integers wider than 64 bits,
+    non-string keys) are also encoded with :func:`json.dumps`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
+
+__all__ = ["ORJSON_AVAILABLE", "dumps", "loads"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
@@ -10,6 +11,7 @@ from typing import Any
 
 import requests
 
+from ._http import shared_session
 from .fingerprint import ReleaseInfo
 from .i18n import _
 
@@ -18,6 +20,12 @@ _MBID_PATTERN = re.compile(
 )
 
 
+# MusicBrainz rate-limits per client IP, so every client in the process shares one
+# request clock (identify-batch --workers builds a client per file).
+_RATE_LIMIT_LOCK = threading.Lock()
+_last_request = 0.0
+
+
 class MusicBrainzError(RuntimeError):
     """Raised when the MusicBrainz API cannot satisfy a request."""
 
@@ -60,10 +68,9 @@ class MusicBrainzClient:
     """Thin wrapper around the JSON MusicBrainz API."""
 
     def __init__(self, settings: MusicBrainzSettings) -> None:
-        """Store connection settings and prepare an HTTP session."""
+        """Store connection settings and attach the shared keep-alive HTTP session."""
         self._settings = settings
-        self._session = requests.Session()
-        self._last_request = 0.0
+        self._session = shared_session()
         self._recording_cache: OrderedDict[str, MusicBrainzRecording | None] = OrderedDict()
 
     def lookup_recording(self, recording_id: str) -> MusicBrainzRecording | None:
@@ -165,15 +172,15 @@ class MusicBrainzClient:
         raise MusicBrainzError(_("MusicBrainz request failed: exceeded retry budget."))
 
     def _respect_rate_limit(self) -> None:
-        delay = 0.0
-        if self._settings.rate_limit_per_second > 0:
-            delay = max(0.0, 1.0 / self._settings.rate_limit_per_second)
-        if delay:
-            now = time.monotonic()
-            elapsed = now - self._last_request
+        global _last_request
+        if self._settings.rate_limit_per_second <= 0:
+            return
+        delay = 1.0 / self._settings.rate_limit_per_second
+        with _RATE_LIMIT_LOCK:
+            elapsed = time.monotonic() - _last_request
             if elapsed < delay:
                 time.sleep(delay - elapsed)
-            self._last_request = time.monotonic()
+            _last_request = time.monotonic()
 
     def _sleep_before_retry(self, attempt: int, response: requests.Response | None) -> None:
         retry_after = 0.0
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -14,7 +15,13 @@ from recozik_core.i18n import _
 from .callbacks import PrintCallbacks, ServiceCallbacks
 from .cli_support.metadata import extract_audio_metadata
 from .cli_support.musicbrainz import MusicBrainzOptions, MusicBrainzSettings
-from .identify import AudDConfig, IdentifyRequest, IdentifyServiceError, identify_track
+from .identify import (
+    AudDConfig,
+    IdentifyRequest,
+    IdentifyResponse,
+    IdentifyServiceError,
+    identify_track,
+)
 
 
 @dataclass(slots=True)
@@ -53,6 +60,7 @@ class BatchRequest:
     limit: int
     best_only: bool
     metadata_extractor: Callable[[Path], dict[str, str] | None] = extract_audio_metadata
+    workers: int = 1
 
 
 @dataclass(slots=True)
@@ -64,10 +72,48 @@ class BatchSummary:
     failures: int
 
 
+_Outcome = IdentifyResponse | IdentifyServiceError
+
+
 def _default_callbacks() -> ServiceCallbacks:
     return PrintCallbacks()
 
 
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _iter_outcomes(
+    files: list[Path],
+    identify_one: Callable[[Path], _Outcome],
+    workers: int,
+) -> Iterator[tuple[Path, _Outcome]]:
+    """Yield ``(path, outcome)`` pairs in input order, identifying files concurrently.
+
+    Work is submitted largest file first so long fingerprints do not end up at the
+    tail of the batch; results are still reported in the original order.
+    """
+    if workers <= 1 or len(files) <= 1:
+        for file_path in files:
+            yield file_path, identify_one(file_path)
+        return
+
+    order = sorted(range(len(files)), key=lambda index: _file_size(files[index]), reverse=True)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recozik-batch") as executor:
+        futures: dict[int, Future[_Outcome]] = {
+            index: executor.submit(identify_one, files[index]) for index in order
+        }
+        try:
+            for index, file_path in enumerate(files):
+                yield file_path, futures[index].result()
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+
 def run_batch_identify(
     request: BatchRequest,
     *,
@@ -91,8 +137,12 @@ def run_batch_identify(
     failures = 0
     effective_limit = 1 if request.best_only else max(request.limit, 1)
 
-    for file_path in request.files:
-        display_path = path_formatter(file_path)
+    identify_params = dict(identify_kwargs or {})
+    identify_params.setdefault("cache", cache)
+    identify_params.setdefault("persist_cache", False)
+    identify_params.setdefault("metadata_extractor", request.metadata_extractor)
+
+    def identify_one(file_path: Path) -> _Outcome:
         identify_request = IdentifyRequest(
             audio_path=file_path,
             fpcalc_path=request.fpcalc_path,
@@ -105,18 +155,18 @@ def run_batch_identify(
             musicbrainz_settings=request.musicbrainz_settings,
             metadata_fallback=request.metadata_fallback,
         )
-        identify_params = dict(identify_kwargs or {})
-        identify_params.setdefault("cache", cache)
-        identify_params.setdefault("persist_cache", False)
-        identify_params.setdefault("metadata_extractor", request.metadata_extractor)
-
         try:
-            response = identify_track(
+            return identify_track(
                 identify_request,
                 callbacks=callbacks,
                 **identify_params,
             )
         except IdentifyServiceError as exc:
+            return exc
+
+    for file_path, response in _iter_outcomes(list(request.files), identify_one, request.workers):
+        display_path = path_formatter(file_path)
+        if isinstance(response, IdentifyServiceError):
             failures += 1
             if log_consumer:
                 log_consumer(
@@ -127,7 +177,7 @@ def run_batch_identify(
                         matches=[],
                         status="error",
                         note=None,
-                        error=str(exc),
+                        error=str(response),
                         metadata=None,
                     )
                 )
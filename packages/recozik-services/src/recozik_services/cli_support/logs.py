@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from string import Formatter
 from typing import TYPE_CHECKING
 
+from recozik_core import json_codec
 from recozik_core.i18n import _
 
 if TYPE_CHECKING:
@@ -19,6 +21,34 @@ class _SafeDict(dict):
         return ""
 
 
+_FORMATTER = Formatter()
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str) -> tuple[tuple[str, str | None, str, str | None], ...] | None:
+    """Parse ``template`` once; return ``None`` when it needs the full formatter."""
+    parts: list[tuple[str, str | None, str, str | None]] = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if field_name is not None and (not field_name.isidentifier() or "{" in format_spec):
+            return None
+        parts.append((literal, field_name, format_spec or "", conversion))
+    return tuple(parts)
+
+
+def _render_template(template: str, context: Mapping[str, str]) -> str:
+    """Render ``template`` like ``Formatter.vformat`` with missing fields left empty."""
+    parts = _compile_template(template)
+    if parts is None:
+        return _FORMATTER.vformat(template, (), _SafeDict(context))
+    chunks: list[str] = []
+    for literal, field_name, format_spec, conversion in parts:
+        chunks.append(literal)
+        if field_name is not None:
+            value = _FORMATTER.convert_field(context.get(field_name, ""), conversion)
+            chunks.append(format(value, format_spec))
+    return "".join(chunks)
+
+
 def extract_template_fields(template: str) -> set[str]:
     """Return the placeholder field names used by ``template``."""
     formatter = Formatter()
@@ -36,12 +66,10 @@ def extract_template_fields(template: str) -> set[str]:
 def format_match_template(match: AcoustIDMatch, template: str) -> str:
     """Render the template with the match context."""
     context = _build_match_context(match)
-    formatter = Formatter()
     try:
-        return formatter.vformat(template, (), _SafeDict(context))
+        return _render_template(template, context)
     except Exception:  # pragma: no cover - defensive fallback
-        fallback = "{artist} - {title}"
-        return formatter.vformat(fallback, (), _SafeDict(context))
+        return _render_template("{artist} - {title}", context)
 
 
 def _build_match_context(match: AcoustIDMatch) -> dict[str, str]:
@@ -108,7 +136,7 @@ def write_log_entry(
             ],
             "metadata": metadata or None,
         }
-        handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        handle.write(json_codec.dumps(entry) + "\n")
         return
 
     handle.write(f"file: {path_display}\n")
@@ -143,7 +171,7 @@ def load_jsonl_log(path: Path) -> list[dict]:
             if not stripped:
                 continue
             try:
-                payload = json.loads(stripped)
+                payload = json_codec.loads(stripped)
             except json.JSONDecodeError as exc:
                 raise ValueError(
                     _("The log must be JSONL (rerun `identify-batch` with --log-format jsonl).")
@@ -171,10 +199,9 @@ def render_log_template(match: dict, template: str, source_path: Path) -> str:
     }
 
     formatted = match.get("formatted")
-    formatter = Formatter()
     try:
-        return formatter.vformat(template, (), _SafeDict(context))
+        return _render_template(template, context)
     except Exception:
         if formatted:
             return formatted
-        return formatter.vformat("{artist} - {title}", (), _SafeDict(context))
+        return _render_template("{artist} - {title}", context)
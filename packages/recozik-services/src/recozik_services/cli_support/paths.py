@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import os
+from collections.abc import Iterable, Iterator, Set
 from pathlib import Path
 
 INVALID_FILENAME_CHARS = set('<>:"/\\|?*')
@@ -31,13 +32,17 @@ def discover_audio_files(
     *,
     recursive: bool,
     patterns: Iterable[str],
-    extensions: set[str],
+    extensions: Set[str],
 ) -> Iterable[Path]:
     """Yield audio files matching the provided selection criteria."""
     base_dir = base_dir.resolve()
     seen: set[Path] = set()
+    allowed = frozenset(extensions)
 
     def should_keep(path: Path) -> bool:
+        # Check the suffix first so non-audio entries never cost a stat() call.
+        if allowed and not _has_extension(path.name, allowed):
+            return False
         try:
             if path.is_symlink():
                 return False
@@ -45,24 +50,22 @@ def discover_audio_files(
                 return False
         except OSError:
             return False
-        if extensions and path.suffix.lower() not in extensions:
-            return False
         return True
 
     iterator_patterns = list(patterns)
+    if not iterator_patterns:
+        # Plain directory listings skip pathlib entirely: ``os.DirEntry`` already
+        # knows its type, and paths under the resolved base without symlinks are
+        # already canonical, so no per-entry stat() or resolve() is needed.
+        yield from _scan_files(base_dir, recursive=recursive, extensions=allowed)
+        return
 
     def iterate() -> Iterable[Path]:
-        if iterator_patterns:
-            for pattern in iterator_patterns:
-                if recursive:
-                    yield from base_dir.rglob(pattern)
-                else:
-                    yield from base_dir.glob(pattern)
-        else:
+        for pattern in iterator_patterns:
             if recursive:
-                yield from base_dir.rglob("*")
+                yield from base_dir.rglob(pattern)
             else:
-                yield from base_dir.glob("*")
+                yield from base_dir.glob(pattern)
 
     for candidate in iterate():
         if not should_keep(candidate):
@@ -74,6 +77,35 @@ def discover_audio_files(
         yield resolved
 
 
+def _has_extension(name: str, extensions: Set[str]) -> bool:
+    # ``os.path.splitext`` treats a leading dot as part of the stem, so a dotfile
+    # named exactly ``.mp3`` has no extension and is never selected.
+    return os.path.splitext(name)[1].lower() in extensions
+
+
+def _scan_files(directory: Path, *, recursive: bool, extensions: Set[str]) -> Iterator[Path]:
+    """Yield regular files below ``directory`` with ``os.scandir``, never following symlinks."""
+    pending = [os.fspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                            continue
+                        if extensions and not _has_extension(entry.name, extensions):
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
 def sanitize_filename(name: str) -> str:
     """Return a filesystem-friendly version of a filename."""
     sanitized_chars: list[str] = []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import typer
@@ -14,12 +15,19 @@ class TyperCallbacks(ServiceCallbacks):
 
     use_stderr: bool = True
     warning_stderr: bool = True
+    stdout_echo: Callable[[str], None] | None = None
+
+    def _echo(self, message: str, err: bool) -> None:
+        if not err and self.stdout_echo is not None:
+            self.stdout_echo(message)
+        else:
+            typer.echo(message, err=err)
 
     def info(self, message: str) -> None:
-        typer.echo(message, err=self.use_stderr)
+        self._echo(message, self.use_stderr)
 
     def warning(self, message: str) -> None:
-        typer.echo(message, err=self.warning_stderr)
+        self._echo(message, self.warning_stderr)
 
     def error(self, message: str) -> None:
         typer.echo(message, err=True)
@@ -63,16 +63,18 @@ def _cli_override(name: str, default: T) -> T:
     return cast(T, cli_symbols.get(name, default))
 
 
-DEFAULT_AUDIO_EXTENSIONS = {
-    ".mp3",
-    ".flac",
-    ".wav",
-    ".ogg",
-    ".m4a",
-    ".aac",
-    ".opus",
-    ".wma",
-}
+DEFAULT_AUDIO_EXTENSIONS = frozenset(
+    {
+        ".mp3",
+        ".flac",
+        ".wav",
+        ".ogg",
+        ".m4a",
+        ".aac",
+        ".opus",
+        ".wma",
+    }
+)
 _VALIDATION_TRACK_ID = "9ff43b6a-4f16-427c-93c2-92307ca505e0"
 _VALIDATION_ENDPOINT = "https://api.acoustid.org/v2/lookup"
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any, TypeVar, cast
@@ -39,6 +41,7 @@ from recozik_services.cli_support.prompts import prompt_yes_no
 from recozik_services.identify import AudDConfig as ServiceAudDConfig
 
 from recozik_core.audd import AudDEnterpriseParams, AudDMode, SnippetInfo
+from recozik_core.config import MAX_IDENTIFY_BATCH_WORKERS
 from recozik_core.fingerprint import AcoustIDMatch
 from recozik_core.i18n import _
 
@@ -48,6 +51,40 @@ from .identify import DEFAULT_AUDIO_EXTENSIONS, configure_api_key_interactively
 
 T = TypeVar("T")
 
+# Log records are small; a larger buffer batches them into fewer write() calls.
+_LOG_BUFFER_SIZE = 1 << 16
+# Per-file status lines echoed together when stdout is not a terminal.
+_STDOUT_BATCH_LINES = 50
+
+
+class _StdoutBatcher:
+    """Collect status lines and echo them in blocks of ``size`` lines.
+
+    ``--workers`` threads report progress concurrently, so the pending lines are
+    swapped out under a lock and echoed outside it.
+    """
+
+    __slots__ = ("_lines", "_lock", "_size")
+
+    def __init__(self, size: int) -> None:
+        self._lines: list[str] = []
+        self._lock = threading.Lock()
+        self._size = max(size, 1)
+
+    def echo(self, message: str) -> None:
+        with self._lock:
+            self._lines.append(message)
+            if len(self._lines) < self._size:
+                return
+            lines, self._lines = self._lines, []
+        typer.echo("\n".join(lines))
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._lines = self._lines, []
+        if lines:
+            typer.echo("\n".join(lines))
+
 
 def _cli_override(name: str, default: T) -> T:
     """Return a CLI-level override when tests monkeypatch recozik.cli."""
@@ -173,6 +210,13 @@ def identify_batch(
         max=10,
         help=_("Number of results to store per file."),
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        max=MAX_IDENTIFY_BATCH_WORKERS,
+        help=_("Number of files to identify in parallel."),
+    ),
     best_only: bool = typer.Option(
         False,
         "--best-only",
@@ -504,6 +548,14 @@ def identify_batch(
         transform=lambda value: max(value, 1),
     )
 
+    workers_value = resolve_option(
+        ctx,
+        "workers",
+        workers,
+        config.identify_batch_workers,
+        transform=lambda value: max(value, 1),
+    )
+
     best_only_value = resolve_option(
         ctx,
         "best_only",
@@ -595,6 +647,9 @@ def identify_batch(
             return AudDMode.STANDARD
         return audd_mode_value
 
+    # Interactive sessions keep line-by-line progress; pipes and CI logs get blocks.
+    stdout_batch = _StdoutBatcher(1 if sys.stdout.isatty() else _STDOUT_BATCH_LINES)
+
     def run_audd_for_file(
         path: Path,
         display_path: str,
@@ -662,7 +717,7 @@ def identify_batch(
                         message = _(
                             "AudD lookup failed for {path}: {error}. Falling back to AcoustID."
                         ).format(path=display_path, error=last_error)
-                    typer.echo(message)
+                    stdout_batch.echo(message)
                     return cast(list[AcoustIDMatch], [])
 
             try:
@@ -674,7 +729,7 @@ def identify_batch(
                 )
             except audd_error_cls as exc:
                 last_error = str(exc)
-                typer.echo(
+                stdout_batch.echo(
                     _("AudD lookup failed for {path}: {error}").format(
                         path=display_path,
                         error=last_error,
@@ -779,6 +834,7 @@ def identify_batch(
         limit=limit_value,
         best_only=bool(best_only_value),
         metadata_extractor=metadata_extractor,
+        workers=workers_value,
     )
 
     path_cache: dict[Path, str] = {}
@@ -797,7 +853,7 @@ def identify_batch(
         path_cache[path] = display
         return display
 
-    callbacks_bridge = TyperCallbacks(use_stderr=False)
+    callbacks_bridge = TyperCallbacks(use_stderr=False, stdout_echo=stdout_batch.echo)
     identify_kwargs = {
         "compute_fingerprint_fn": compute_fingerprint,
         "lookup_recordings_fn": lookup_recordings,
@@ -806,7 +862,7 @@ def identify_batch(
         "lookup_cache_cls": lookup_cache_cls,
     }
 
-    with log_path.open(mode, encoding="utf-8") as handle:
+    with log_path.open(mode, buffering=_LOG_BUFFER_SIZE, encoding="utf-8") as handle:
 
         def consume(entry) -> None:
             write_log_entry(
@@ -822,20 +878,23 @@ def identify_batch(
                 metadata=entry.metadata,
             )
             if entry.status == "unmatched" and entry.metadata:
-                typer.echo(
+                stdout_batch.echo(
                     _("No match for {path}, embedded metadata recorded in the log.").format(
                         path=entry.display_path
                     )
                 )
 
-        summary = run_batch_identify(
-            batch_request,
-            callbacks=callbacks_bridge,
-            log_consumer=consume,
-            path_formatter=format_display,
-            lookup_cache_cls=lookup_cache_cls,
-            identify_kwargs=identify_kwargs,
-        )
+        try:
+            summary = run_batch_identify(
+                batch_request,
+                callbacks=callbacks_bridge,
+                log_consumer=consume,
+                path_formatter=format_display,
+                lookup_cache_cls=lookup_cache_cls,
+                identify_kwargs=identify_kwargs,
+            )
+        finally:
+            stdout_batch.flush()
 
     typer.echo(_("Processing complete."))
     typer.echo(
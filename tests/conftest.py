@@ -2,41 +2,70 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
+import soundfile
 from typer.testing import CliRunner
 
+from recozik import cli
 from recozik_core import secrets as secret_store
 
-from .helpers.rename import write_jsonl_log
+from .helpers.identify import DummyLookupCache
+from .helpers.rename import serialize_jsonl, write_payload
 
 
-@pytest.fixture(autouse=True)
-def force_english_locale(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Force tests to use the English locale unless explicitly overridden."""
-    monkeypatch.setenv("RECOZIK_LOCALE", "en")
+def _install_english_locale(*, only_if_changed: bool = False) -> None:
     try:
-        from recozik_core.i18n import set_locale
+        from recozik_core.i18n import get_current_locale, set_locale
     except ModuleNotFoundError:  # pragma: no cover - during initial imports
         return
+    if only_if_changed and get_current_locale() == "en":
+        return
     set_locale("en")
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _english_translations() -> None:
+    """Load the English translations once for the whole session."""
+    _install_english_locale()
+
+
+@pytest.fixture(autouse=True)
+def force_english_locale(
+    monkeypatch: pytest.MonkeyPatch, _english_translations: None
+) -> Iterator[None]:
+    """Force each test to use the English locale unless explicitly overridden."""
+    monkeypatch.setenv("RECOZIK_LOCALE", "en")
+    yield
+    _install_english_locale(only_if_changed=True)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the custom markers used across the suite."""
+    config.addinivalue_line(
+        "markers",
+        "identify_stub(fingerprint=..., matches=..., audd_matches=...): "
+        "install stubbed fingerprinting, lookup, and AudD results for identify tests",
+    )
+
+
 class _InMemorySecretBackend:
     def __init__(self) -> None:
-        self._store: dict[tuple[str, str], str] = {}
+        self._store: dict[str, dict[str, str]] = {}
 
     def get_password(self, service: str, username: str) -> str | None:
-        return self._store.get((service, username))
+        return self._store.get(service, {}).get(username)
 
     def set_password(self, service: str, username: str, password: str) -> None:
-        self._store[(service, username)] = password
+        self._store.setdefault(service, {})[username] = password
 
     def delete_password(self, service: str, username: str) -> None:
-        self._store.pop((service, username), None)
+        self._store.get(service, {}).pop(username, None)
 
 
 @pytest.fixture(autouse=True)
@@ -48,17 +77,81 @@ def fake_secret_backend() -> None:
     secret_store.configure_secret_backend(None)
 
 
+def _write_stereo_tone(path: Path, sample_rate: int = 44_100, seconds: int = 2) -> Path:
+    frames = sample_rate * seconds
+    phase = np.arange(frames, dtype=np.float32)
+    phase *= np.float32(2 * np.pi / sample_rate)
+    stereo = np.empty((frames, 2), dtype=np.float32)
+    for channel, frequency in enumerate((440, 330)):
+        column = stereo[:, channel]
+        np.multiply(phase, np.float32(frequency), out=column)
+        np.sin(column, out=column)
+    soundfile.write(path, stereo, sample_rate)
+    return path
+
+
+def _write_mono_tone(path: Path, sample_rate: int = 16_000, seconds: int = 2) -> Path:
+    samples = np.arange(sample_rate * seconds, dtype=np.float32)
+    samples *= np.float32(2 * np.pi * 440 / sample_rate)
+    np.sin(samples, out=samples)
+    soundfile.write(path, samples, sample_rate)
+    return path
+
+
+@dataclass(frozen=True, slots=True)
+class AudDTones:
+    """Read-only synthetic WAV files shared by the AudD tests."""
+
+    stereo_44k1: Path
+    mono_16k_2s: Path
+    mono_16k_0_25s: Path
+
+
+@pytest.fixture(scope="session")
+def audd_tones(tmp_path_factory: pytest.TempPathFactory) -> AudDTones:
+    """Encode the AudD test audio once per session (once per worker under xdist)."""
+    base = tmp_path_factory.mktemp("audio")
+    silence = base / "mono-16k-0.25s.wav"
+    soundfile.write(silence, np.zeros(4000, dtype=np.float32), 16_000)
+    return AudDTones(
+        stereo_44k1=_write_stereo_tone(base / "stereo-44k1.wav"),
+        mono_16k_2s=_write_mono_tone(base / "mono-16k-2s.wav"),
+        mono_16k_0_25s=silence,
+    )
+
+
 @pytest.fixture()
+def dummy_lookup_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route the CLI lookup cache to the in-memory ``DummyLookupCache``."""
+    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
+
+
+@pytest.fixture(scope="session")
+def shared_audio(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a placeholder audio file for tests that stub fingerprinting entirely."""
+    audio_path = tmp_path_factory.mktemp("shared-audio") / "song.wav"
+    audio_path.write_bytes(b"fake")
+    return audio_path
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Return a new CLI runner for each test."""
+    """Return a CLI runner shared by the whole session (it keeps no per-invocation state)."""
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def _jsonl_cache() -> dict[str, bytes]:
+    """Share serialized JSONL payloads across tests writing identical logs."""
+    return {}
+
+
 @dataclass(slots=True)
 class RenameTestEnv:
     """Utility wrapper that streamlines fixture setup for rename CLI tests."""
 
     base: Path
+    jsonl_cache: dict[str, bytes] = field(default_factory=dict)
 
     def make_root(self, name: str) -> Path:
         """Create and return a root directory rooted in the temp base."""
@@ -68,18 +161,24 @@ class RenameTestEnv:
 
     def create_source(self, root: Path, filename: str, data: bytes = b"data") -> Path:
         """Create a source file within ``root`` containing ``data``."""
-        src = root / filename
-        src.write_bytes(data)
-        return src
+        return write_payload(root / filename, data)
+
+    def create_sources(self, root: Path, files: Mapping[str, bytes]) -> list[Path]:
+        """Create several source files within ``root`` and return their paths in order."""
+        return [write_payload(root / filename, data) for filename, data in files.items()]
 
     def write_log(self, filename: str, entries: list[dict[str, Any]]) -> Path:
         """Write a JSONL log file under the temporary base directory."""
         log_path = self.base / filename
-        write_jsonl_log(log_path, entries)
-        return log_path
+        key = repr(entries)
+        payload = self.jsonl_cache.get(key)
+        if payload is None:
+            payload = serialize_jsonl(entries)
+            self.jsonl_cache[key] = payload
+        return write_payload(log_path, payload)
 
 
 @pytest.fixture()
-def rename_env(tmp_path: Path) -> RenameTestEnv:
+def rename_env(tmp_path: Path, _jsonl_cache: dict[str, bytes]) -> RenameTestEnv:
     """Provide helpers to create rename roots, sources, and logs."""
-    return RenameTestEnv(base=tmp_path)
+    return RenameTestEnv(base=tmp_path, jsonl_cache=_jsonl_cache)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 from recozik.fingerprint import AcoustIDMatch
 
 
+class DummyAudDError(Exception):
+    """Stand-in for ``audd.AudDLookupError`` when AudD calls are stubbed."""
+
+
 class DummyLookupCache:
     """In-memory stub of the lookup cache API used in tests."""
 
@@ -36,6 +43,17 @@ class DummyLookupCache:
         return None
 
 
+@functools.lru_cache(maxsize=64)
+def _render_config(api_key: str, extra_lines: tuple[str, ...]) -> bytes:
+    lines = [
+        "[acoustid]",
+        f'api_key = "{api_key}"',
+        "",
+        *extra_lines,
+    ]
+    return "\n".join(lines).encode("utf-8")
+
+
 def make_config(
     tmp_path: Path,
     *,
@@ -44,14 +62,16 @@ def make_config(
 ) -> Path:
     """Write a configuration file with optional extra sections."""
     config_path = tmp_path / "config.toml"
-    lines = [
-        "[acoustid]",
-        f'api_key = "{api_key}"',
-        "",
-    ]
-    lines.extend(extra_lines)
-    config_path.write_text("\n".join(lines), encoding="utf-8")
+    config_path.write_bytes(_render_config(api_key, tuple(extra_lines)))
     return config_path
 
 
-__all__ = ["DummyLookupCache", "make_config"]
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    """Yield the decoded records of a JSONL log one line at a time, skipping blank lines."""
+    with path.open("rb", buffering=1 << 20) as handle:
+        while line := handle.readline():
+            if line.strip():
+                yield json.loads(line)
+
+
+__all__ = ["DummyAudDError", "DummyLookupCache", "iter_jsonl", "make_config"]
@@ -3,20 +3,50 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
 from typer.testing import CliRunner
 
+from recozik import cli
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None  # type: ignore[assignment]
+
+
+def serialize_jsonl(entries: Sequence[Mapping[str, Any]]) -> bytes:
+    """Return ``entries`` encoded as UTF-8 JSONL bytes."""
+    if not entries:
+        return b""
+    if orjson is not None:
+        return b"\n".join(orjson.dumps(entry) for entry in entries) + b"\n"
+    buffer = "\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries)
+    return (buffer + "\n").encode("utf-8")
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_payload(path: Path, payload: bytes) -> Path:
+    """Write ``payload`` to ``path`` with raw ``os.write`` calls, bypassing file objects."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    return path
+
 
 def write_jsonl_log(path: Path, entries: Sequence[Mapping[str, Any]]) -> Path:
     """Write entries to ``path`` in JSONL format and return the path."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
-    return path
+    return write_payload(path, serialize_jsonl(entries))
 
 
 def make_match(
@@ -102,10 +132,8 @@ def invoke_rename(
     input: str | None = None,
 ):
     """Invoke the CLI with the provided ``command`` sequence."""
-    from recozik import cli
-
     command_args = [str(arg) for arg in command]
-    return runner.invoke(cli.app, command_args, input=input)
+    return runner.invoke(cli.app, command_args, input=input, catch_exceptions=False)
 
 
 def build_rename_command(
@@ -145,5 +173,7 @@ __all__ = [
     "make_entry",
     "make_match",
     "make_metadata",
+    "serialize_jsonl",
     "write_jsonl_log",
+    "write_payload",
 ]
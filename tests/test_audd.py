@@ -11,6 +11,8 @@ import soundfile
 
 from recozik import audd
 
+from .conftest import AudDTones
+
 
 def test_needs_audd_snippet_threshold(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     """Flag files larger than the configured AudD limit."""
@@ -26,18 +28,10 @@ def test_needs_audd_snippet_threshold(monkeypatch: pytest.MonkeyPatch, tmp_path:
 
 def test_recognize_with_audd_uses_snippet_when_large(
     monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
+    audd_tones: AudDTones,
 ) -> None:
     """Downsample and trim audio before sending it to AudD."""
-    audio_path = tmp_path / "tone.wav"
-    duration = 2.0
-    sample_rate = 44_100
-    time_axis = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    stereo = np.stack(
-        [np.sin(2 * np.pi * 440 * time_axis), np.sin(2 * np.pi * 330 * time_axis)],
-        axis=1,
-    ).astype("float32")
-    soundfile.write(audio_path, stereo, sample_rate)
+    audio_path = audd_tones.stereo_44k1
 
     monkeypatch.setattr(audd, "MAX_AUDD_BYTES", 2048)
 
@@ -64,7 +58,7 @@ def test_recognize_with_audd_uses_snippet_when_large(
         captured["name"] = file_tuple[0]
         return DummyResponse()
 
-    monkeypatch.setattr(audd.requests, "post", fake_post)
+    monkeypatch.setattr(audd.shared_session(), "post", fake_post)
 
     matches = audd.recognize_with_audd("token", audio_path)
     assert matches, "AudD should return at least one match"
@@ -88,7 +82,7 @@ def test_recognize_with_audd_redacts_token_in_errors(
     def fake_post(url, data, files, timeout):
         raise requests.RequestException(f"error sending {data}")
 
-    monkeypatch.setattr(audd.requests, "post", fake_post)
+    monkeypatch.setattr(audd.shared_session(), "post", fake_post)
 
     token = "super-secret-token"  # noqa: S105 - test fixture value
     with pytest.raises(audd.AudDLookupError) as excinfo:
@@ -155,16 +149,11 @@ def test_render_snippet_reports_ffmpeg_failure(
     assert "ffmpeg pipeline unavailable" in message
 
 
-def test_render_snippet_supports_offset(tmp_path: Path) -> None:
+def test_render_snippet_supports_offset(tmp_path: Path, audd_tones: AudDTones) -> None:
     """Apply the configured offset when preparing the AudD snippet."""
-    audio_path = tmp_path / "tone.wav"
-    duration = 2.0
-    sample_rate = 16_000
-    time_axis = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    mono = np.sin(2 * np.pi * 440 * time_axis).astype("float32")
-    soundfile.write(audio_path, mono, sample_rate)
-
+    audio_path = audd_tones.mono_16k_2s
     destination = tmp_path / "snippet.wav"
+
     info = audd._render_snippet(  # type: ignore[attr-defined]
         audio_path,
         destination,
@@ -179,12 +168,11 @@ def test_render_snippet_supports_offset(tmp_path: Path) -> None:
     assert info.rms > 0
 
 
-def test_render_snippet_rejects_offset_beyond_duration(tmp_path: Path) -> None:
+def test_render_snippet_rejects_offset_beyond_duration(
+    tmp_path: Path, audd_tones: AudDTones
+) -> None:
     """Raise an error when the requested offset exceeds the audio duration."""
-    audio_path = tmp_path / "tone.wav"
-    mono = np.zeros(4000, dtype="float32")
-    soundfile.write(audio_path, mono, 16_000)
-
+    audio_path = audd_tones.mono_16k_0_25s
     destination = tmp_path / "snippet.wav"
 
     with pytest.raises(audd.AudDLookupError):
@@ -0,0 +1,90 @@
+"""Tests for the AcoustID lookup cache."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from recozik_core.cache import LookupCache
+from recozik_core.fingerprint import AcoustIDMatch, ReleaseInfo
+
+
+def test_lookup_cache_round_trip(tmp_path: Path) -> None:
+    """Persist matches to disk and load them back in a fresh cache instance."""
+    cache_path = tmp_path / "lookup-cache.json"
+    match = AcoustIDMatch(
+        score=0.87,
+        recording_id="mbid-1",
+        title="Titre",
+        artist="Artiste",
+        releases=[ReleaseInfo(title="Album", release_id="rel-1")],
+    )
+
+    cache = LookupCache(cache_path)
+    cache.set("FP", 120.4, [match])
+    cache.save()
+
+    reloaded = LookupCache(cache_path)
+    assert reloaded.get("FP", 120.2) == [match]
+
+
+def test_lookup_cache_ignores_corrupt_file(tmp_path: Path) -> None:
+    """Start from an empty cache when the file cannot be decoded."""
+    cache_path = tmp_path / "lookup-cache.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    assert LookupCache(cache_path).get("FP", 120.0) is None
+
+
+def test_lookup_cache_reads_entries_keyed_by_full_fingerprint(tmp_path: Path) -> None:
+    """Keep hitting entries saved under the older ``fingerprint:duration`` keys."""
+    cache_path = tmp_path / "lookup-cache.json"
+    match = AcoustIDMatch(score=0.5, recording_id="mbid", title="Titre", artist="Artiste")
+    entry = {
+        "fingerprint": "FP",
+        "duration_seconds": 120.0,
+        "timestamp": time.time(),
+        "matches": [match.to_dict()],
+    }
+    cache_path.write_text(json.dumps({"FP:120": entry}), encoding="utf-8")
+
+    assert LookupCache(cache_path).get("FP", 119.8) == [match]
+
+
+def test_lookup_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Drop the least recently used entry once the cache exceeds its bound."""
+    cache_path = tmp_path / "lookup-cache.json"
+    match = AcoustIDMatch(score=0.5, recording_id="mbid", title="Titre", artist="Artiste")
+
+    cache = LookupCache(cache_path, max_entries=2)
+    cache.set("A", 100.0, [match])
+    cache.set("B", 100.0, [match])
+    assert cache.get("A", 100.0) == [match]
+    cache.set("C", 100.0, [match])
+    cache.save()
+
+    reloaded = LookupCache(cache_path, max_entries=2)
+    assert reloaded.get("B", 100.0) is None
+    assert reloaded.get("A", 100.0) == [match]
+    assert reloaded.get("C", 100.0) == [match]
+
+
+def test_lookup_cache_persists_recency_of_reloaded_hits(tmp_path: Path) -> None:
+    """Keep an entry touched after a reload once a new entry forces an eviction."""
+    cache_path = tmp_path / "lookup-cache.json"
+    match = AcoustIDMatch(score=0.5, recording_id="mbid", title="Titre", artist="Artiste")
+
+    cache = LookupCache(cache_path, max_entries=2)
+    cache.set("A", 100.0, [match])
+    cache.set("B", 100.0, [match])
+    cache.save()
+
+    touched = LookupCache(cache_path, max_entries=2)
+    assert touched.get("A", 100.0) == [match]
+    touched.save()
+
+    reloaded = LookupCache(cache_path, max_entries=2)
+    reloaded.set("C", 100.0, [match])
+    assert reloaded.get("A", 100.0) == [match]
+    assert reloaded.get("B", 100.0) is None
@@ -3,46 +3,67 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from recozik import audd, cli
 from recozik.config import AppConfig, write_config
 from recozik.fingerprint import AcoustIDMatch, FingerprintResult, ReleaseInfo
 
-from .helpers.identify import DummyLookupCache, make_config
+from .helpers.identify import DummyAudDError, DummyLookupCache, make_config
+
+_CONFIG_DEFAULTS_TOML = """\
+[acoustid]
+api_key = "token"
+
+[identify]
+limit = 1
+json = true
+refresh = true
+"""
+_FALLBACK_TEXT_RE = re.compile(rb"(?s)Fallback Artist - Fallback Song.*Recording ID: audd-match")
+_INPUT_NO = b"n\n"
+_INPUT_YES = b"o\n"
+_STUB_FINGERPRINT = FingerprintResult(fingerprint="FP", duration_seconds=90.0)
+
+pytestmark = pytest.mark.usefixtures("dummy_lookup_cache")
+
+
+@pytest.fixture(autouse=True)
+def _identify_stubs(monkeypatch, request: pytest.FixtureRequest) -> None:
+    """Install the stubs declared by an ``identify_stub`` marker, if any.
+
+    ``matches`` feeds the AcoustID lookup and ``audd_matches`` the AudD recognizer;
+    ``fingerprint`` overrides the default fingerprint result.
+    """
+    marker = request.node.get_closest_marker("identify_stub")
+    if marker is None:
+        return
+    options = marker.kwargs
+    fingerprint = options.get("fingerprint", _STUB_FINGERPRINT)
+    monkeypatch.setattr(cli, "compute_fingerprint", lambda *_args, **_kwargs: fingerprint)
+    if "matches" in options:
+        matches = options["matches"]
+        monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: list(matches))
+    if "audd_matches" in options:
+        audd_matches = options["audd_matches"]
+        monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
+        monkeypatch.setattr(
+            audd, "recognize_with_audd", lambda *_args, **_kwargs: list(audd_matches)
+        )
 
 
 def test_identify_respects_config_defaults(
-    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
 ) -> None:
     """Apply config-provided defaults for limit, JSON rendering, and refresh."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-
     config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        "\n".join(
-            [
-                "[acoustid]",
-                'api_key = "token"',
-                "",
-                "[identify]",
-                "limit = 1",
-                "json = true",
-                "refresh = true",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    config_path.write_text(_CONFIG_DEFAULTS_TOML, encoding="utf-8")
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=102.0),
-    )
+    monkeypatch.setattr(cli, "compute_fingerprint", lambda *_args, **_kwargs: _STUB_FINGERPRINT)
 
     def fake_lookup(api_key, fingerprint_result, meta=None, timeout=None):
         assert api_key == "token"
@@ -81,24 +102,23 @@ def test_identify_respects_config_defaults(
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
         ],
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = json.loads(result.stdout_bytes)
     assert len(payload) == 1
     assert payload[0]["recording_id"] == "id-1"
     assert cache_instances and cache_instances[0].get_called is False
 
 
-def test_identify_success_json(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
+def test_identify_success_json(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
     """Return JSON payload when --json flag is provided."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-
     config_path = make_config(tmp_path)
 
     def fake_compute(_audio_path, fpcalc_path=None):
@@ -119,13 +139,12 @@ def test_identify_success_json(monkeypatch, tmp_path: Path, cli_runner: CliRunne
 
     monkeypatch.setattr(cli, "compute_fingerprint", fake_compute)
     monkeypatch.setattr(cli, "lookup_recordings", fake_lookup)
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
 
     result = cli_runner.invoke(
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--json",
@@ -133,103 +152,117 @@ def test_identify_success_json(monkeypatch, tmp_path: Path, cli_runner: CliRunne
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = json.loads(result.stdout_bytes)
     assert payload[0]["recording_id"] == "mbid-1"
     assert payload[0]["releases"][0]["title"] == "Album"
     assert payload[0]["source"] == "acoustid"
 
 
-def test_identify_success_text(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
-    """Render textual output with recording details."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-
+@pytest.mark.parametrize(
+    ("extra_args", "env", "expected"),
+    [
+        pytest.param(
+            (),
+            None,
+            (
+                "Result 1: score 0.75",
+                "Artiste Exemple - Autre titre",
+                "Album: Album X (2018-05-01)",
+            ),
+            marks=pytest.mark.identify_stub(
+                matches=[
+                    AcoustIDMatch(
+                        score=0.75,
+                        recording_id="mbid-2",
+                        title="Autre titre",
+                        artist="Artiste Exemple",
+                        releases=[ReleaseInfo(title="Album X", date="2018-05-01")],
+                    )
+                ]
+            ),
+            id="text",
+        ),
+        pytest.param(
+            ("--template", "{artist} :: {title}"),
+            None,
+            ("Artiste :: Titre",),
+            marks=pytest.mark.identify_stub(
+                matches=[
+                    AcoustIDMatch(score=0.5, recording_id="rec", title="Titre", artist="Artiste")
+                ]
+            ),
+            id="template-override",
+        ),
+        pytest.param(
+            (),
+            {"RECOZIK_LOCALE": "fr_FR"},
+            ("Résultat 1",),
+            marks=pytest.mark.identify_stub(
+                matches=[
+                    AcoustIDMatch(score=0.42, recording_id="rec", title="Titre", artist="Artiste")
+                ]
+            ),
+            id="locale-env",
+        ),
+    ],
+)
+def test_identify_renders_text_output(
+    tmp_path: Path,
+    cli_runner: CliRunner,
+    shared_audio: Path,
+    extra_args: tuple[str, ...],
+    env: dict[str, str] | None,
+    expected: tuple[str, ...],
+) -> None:
+    """Render matches as text, honoring --template and RECOZIK_LOCALE."""
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=98.1),
-    )
-
-    monkeypatch.setattr(
-        cli,
-        "lookup_recordings",
-        lambda *_args, **_kwargs: [
-            AcoustIDMatch(
-                score=0.75,
-                recording_id="mbid-2",
-                title="Autre titre",
-                artist="Artiste Exemple",
-                releases=[ReleaseInfo(title="Album X", date="2018-05-01")],
-            )
-        ],
-    )
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     result = cli_runner.invoke(
         cli.app,
-        [
-            "identify",
-            str(audio_path),
-            "--config-path",
-            str(config_path),
-        ],
+        ["identify", str(shared_audio), "--config-path", str(config_path), *extra_args],
+        env=env,
     )
 
     assert result.exit_code == 0
-    assert "Result 1: score 0.75" in result.stdout
-    assert "Artiste Exemple - Autre titre" in result.stdout
-    assert "Album: Album X (2018-05-01)" in result.stdout
-
-
+    for needle in expected:
+        assert needle in result.stdout
+
+
+@pytest.mark.identify_stub(
+    matches=[
+        AcoustIDMatch(
+            score=0.99,
+            recording_id="rec-1",
+            title="Titre",
+            artist="Artiste",
+            release_group_title="Album A",
+        ),
+        AcoustIDMatch(
+            score=0.98,
+            recording_id="rec-2",
+            title="Titre",
+            artist="Artiste",
+            release_group_title="Album B",
+        ),
+        AcoustIDMatch(
+            score=0.90,
+            recording_id="rec-3",
+            title="Autre titre",
+            artist="Artiste",
+        ),
+    ]
+)
 def test_identify_deduplicates_by_template(
-    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+    tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
 ) -> None:
     """Collapse matches that render to identical filenames."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=101.4),
-    )
-
-    def fake_lookup(_key, _fingerprint, meta=None, timeout=None):
-        return [
-            AcoustIDMatch(
-                score=0.99,
-                recording_id="rec-1",
-                title="Titre",
-                artist="Artiste",
-                release_group_title="Album A",
-            ),
-            AcoustIDMatch(
-                score=0.98,
-                recording_id="rec-2",
-                title="Titre",
-                artist="Artiste",
-                release_group_title="Album B",
-            ),
-            AcoustIDMatch(
-                score=0.90,
-                recording_id="rec-3",
-                title="Autre titre",
-                artist="Artiste",
-            ),
-        ]
-
-    monkeypatch.setattr(cli, "lookup_recordings", fake_lookup)
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     result = cli_runner.invoke(
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--limit",
@@ -238,122 +271,63 @@ def test_identify_deduplicates_by_template(
     )
 
     assert result.exit_code == 0
-    assert result.stdout.count("Result ") == 2
-    assert "Recording ID: rec-1" in result.stdout
-    assert "Recording ID: rec-3" in result.stdout
-    assert "Recording ID: rec-2" not in result.stdout
-    assert "Result 3" not in result.stdout
-
-
-def test_identify_uses_audd_fallback(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
-    """Call AudD when AcoustID returns no match."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
+    assert result.stdout_bytes.count(b"Result ") == 2
+    assert b"Recording ID: rec-1" in result.stdout_bytes
+    assert b"Recording ID: rec-3" in result.stdout_bytes
+    assert b"Recording ID: rec-2" not in result.stdout_bytes
+    assert b"Result 3" not in result.stdout_bytes
+
+
+@pytest.mark.identify_stub(
+    matches=[],
+    audd_matches=[
+        AcoustIDMatch(
+            score=0.95,
+            recording_id="audd-match",
+            title="Fallback Song",
+            artist="Fallback Artist",
+            release_group_title="Fallback Album",
+        )
+    ],
+)
+def test_identify_uses_audd_fallback(
+    tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
+    """Call AudD when AcoustID returns no match, in both text and JSON output."""
     config_path = make_config(tmp_path)
+    args = [
+        "identify",
+        str(shared_audio),
+        "--config-path",
+        str(config_path),
+        "--audd-token",
+        "secret-token",
+    ]
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=110.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
-    fake_match = AcoustIDMatch(
-        score=0.95,
-        recording_id="audd-match",
-        title="Fallback Song",
-        artist="Fallback Artist",
-        release_group_title="Fallback Album",
-    )
-
-    class DummyAudDError(Exception):
-        pass
-
-    monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
-    monkeypatch.setattr(audd, "recognize_with_audd", lambda token, path, **_kwargs: [fake_match])
-
-    result = cli_runner.invoke(
-        cli.app,
-        [
-            "identify",
-            str(audio_path),
-            "--config-path",
-            str(config_path),
-            "--audd-token",
-            "secret-token",
-        ],
-    )
+    result = cli_runner.invoke(cli.app, args)
 
     assert result.exit_code == 0
-    assert "Fallback Artist - Fallback Song" in result.stdout
-    assert "Recording ID: audd-match" in result.stdout
+    assert _FALLBACK_TEXT_RE.search(result.stdout_bytes)
     assert "Identification strategy: AcoustID first, AudD fallback." in result.stderr
 
-
-def test_identify_fallback_json_includes_source(
-    monkeypatch, tmp_path: Path, cli_runner: CliRunner
-) -> None:
-    """Expose the source field and attribution when returning JSON."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-    config_path = make_config(tmp_path)
-
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
-    fake_match = AcoustIDMatch(
-        score=0.88,
-        recording_id="audd-json",
-        title="JSON Track",
-        artist="Artist",
-    )
-
-    class DummyAudDError(Exception):
-        pass
-
-    monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
-    monkeypatch.setattr(audd, "recognize_with_audd", lambda *_args, **_kwargs: [fake_match])
-
-    result = cli_runner.invoke(
-        cli.app,
-        [
-            "identify",
-            str(audio_path),
-            "--config-path",
-            str(config_path),
-            "--audd-token",
-            "secret-token",
-            "--json",
-        ],
-    )
+    result = cli_runner.invoke(cli.app, [*args, "--json"])
 
     assert result.exit_code == 0
     payload = json.loads(result.stdout)
     assert payload[0]["source"] == "audd"
-    assert payload[0]["recording_id"] == "audd-json"
+    assert payload[0]["recording_id"] == "audd-match"
+    assert payload[0]["title"] == "Fallback Song"
+    assert payload[0]["artist"] == "Fallback Artist"
     assert "Identification strategy: AcoustID first, AudD fallback." in result.stderr
 
 
-def test_identify_can_disable_audd(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
+@pytest.mark.identify_stub(matches=[])
+def test_identify_can_disable_audd(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
     """Skip AudD even when a token is provided."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     def _unexpected_audd(*_args, **_kwargs):
         raise AssertionError("AudD should not be called when --no-audd is set.")
 
@@ -364,7 +338,7 @@ def test_identify_can_disable_audd(monkeypatch, tmp_path: Path, cli_runner: CliR
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--audd-token",
@@ -374,27 +348,22 @@ def test_identify_can_disable_audd(monkeypatch, tmp_path: Path, cli_runner: CliR
     )
 
     assert result.exit_code == 0
-    assert "No matches found." in result.stdout
+    assert b"No matches found." in result.stdout_bytes
     assert "AcoustID only (AudD disabled)." in result.stderr
 
 
-def test_identify_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
+def test_identify_prefer_audd(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
     """Use AudD before AcoustID when requested."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
+    monkeypatch.setattr(cli, "compute_fingerprint", lambda *_args, **_kwargs: _STUB_FINGERPRINT)
 
     def _unexpected_lookup(*_args, **_kwargs):
         raise AssertionError("AcoustID should not be called when AudD already returned matches.")
 
     monkeypatch.setattr(cli, "lookup_recordings", _unexpected_lookup)
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
 
     fake_match = AcoustIDMatch(
         score=0.91,
@@ -403,9 +372,6 @@ def test_identify_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: CliRunner
         artist="Priority Artist",
     )
 
-    class DummyAudDError(Exception):
-        pass
-
     monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
     monkeypatch.setattr(audd, "recognize_with_audd", lambda *_args, **_kwargs: [fake_match])
 
@@ -413,7 +379,7 @@ def test_identify_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: CliRunner
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--audd-token",
@@ -423,24 +389,17 @@ def test_identify_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: CliRunner
     )
 
     assert result.exit_code == 0
-    assert "Priority Artist - Priority Song" in result.stdout
+    assert b"Priority Artist - Priority Song" in result.stdout_bytes
     assert "AudD first, AcoustID fallback." in result.stderr
 
 
-def test_identify_snippet_offset_option(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
+@pytest.mark.identify_stub(matches=[])
+def test_identify_snippet_offset_option(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
     """Shift the AudD snippet when --audd-snippet-offset is provided."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     fake_match = AcoustIDMatch(
         score=0.92,
         recording_id="audd-offset",
@@ -470,7 +429,7 @@ def test_identify_snippet_offset_option(monkeypatch, tmp_path: Path, cli_runner:
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--audd-token",
@@ -483,26 +442,17 @@ def test_identify_snippet_offset_option(monkeypatch, tmp_path: Path, cli_runner:
 
     assert result.exit_code == 0
     assert captured_offsets == [5.0]
-    assert "~5.00s" in result.stdout
-    assert "Artist - Offset Track" in result.stdout
+    assert b"~5.00s" in result.stdout_bytes
+    assert b"Artist - Offset Track" in result.stdout_bytes
 
 
+@pytest.mark.identify_stub(matches=[])
 def test_identify_snippet_low_rms_warning(
-    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
 ) -> None:
     """Emit a warning when the snippet RMS falls below the configured threshold."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     def fake_recognize(token, path, **kwargs):
         hook = kwargs.get("snippet_hook")
         if hook is not None:
@@ -516,7 +466,7 @@ def test_identify_snippet_low_rms_warning(
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--audd-token",
@@ -531,20 +481,13 @@ def test_identify_snippet_low_rms_warning(
     assert "RMS" in result.stderr
 
 
-def test_identify_silent_source(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
+@pytest.mark.identify_stub(matches=[])
+def test_identify_silent_source(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
     """Silence the strategy announcement when requested."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     fake_match = AcoustIDMatch(
         score=0.9,
         recording_id="audd-silent",
@@ -552,9 +495,6 @@ def test_identify_silent_source(monkeypatch, tmp_path: Path, cli_runner: CliRunn
         artist="Silent Artist",
     )
 
-    class DummyAudDError(Exception):
-        pass
-
     monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
     monkeypatch.setattr(audd, "recognize_with_audd", lambda *_args, **_kwargs: [fake_match])
 
@@ -562,7 +502,7 @@ def test_identify_silent_source(monkeypatch, tmp_path: Path, cli_runner: CliRunn
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--audd-token",
@@ -572,26 +512,17 @@ def test_identify_silent_source(monkeypatch, tmp_path: Path, cli_runner: CliRunn
     )
 
     assert result.exit_code == 0
-    assert "Silent Artist - Silent Song" in result.stdout
+    assert b"Silent Artist - Silent Song" in result.stdout_bytes
     assert "Identification strategy" not in result.stderr
 
 
+@pytest.mark.identify_stub(matches=[])
 def test_identify_announces_audd_snippet(
-    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
 ) -> None:
     """Let users know when a snippet is prepared for AudD uploads."""
-    audio_path = tmp_path / "long.wav"
-    audio_path.write_bytes(b"0" * 2048)
     config_path = make_config(tmp_path)
 
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
     fake_match = AcoustIDMatch(
         score=0.91,
         recording_id="audd-snippet",
@@ -599,9 +530,6 @@ def test_identify_announces_audd_snippet(
         artist="Snippet Artist",
     )
 
-    class DummyAudDError(Exception):
-        pass
-
     def fake_recognize(*_args, **kwargs):
         hook = kwargs.get("snippet_hook")
         if hook is not None:
@@ -616,7 +544,7 @@ def test_identify_announces_audd_snippet(
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
             "--audd-token",
@@ -626,15 +554,14 @@ def test_identify_announces_audd_snippet(
     )
 
     assert result.exit_code == 0
-    assert "Preparing AudD snippet" in result.stdout
-    assert "Snippet Artist - Snippet Title" in result.stdout
+    assert b"Preparing AudD snippet" in result.stdout_bytes
+    assert b"Snippet Artist - Snippet Title" in result.stdout_bytes
 
 
-def test_identify_without_key(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
+def test_identify_without_key(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
+) -> None:
     """Abort when no API key is available and the user declines to configure it."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-
     config_path = make_config(tmp_path, api_key="")
 
     monkeypatch.setattr(
@@ -642,73 +569,27 @@ def test_identify_without_key(monkeypatch, tmp_path: Path, cli_runner: CliRunner
         "compute_fingerprint",
         lambda *_args, **_kwargs: FingerprintResult(fingerprint="", duration_seconds=0.0),
     )
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
 
     result = cli_runner.invoke(
         cli.app,
         [
             "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
         ],
-        input="n\n",
+        input=_INPUT_NO,
     )
 
     assert result.exit_code == 1
-    assert "No AcoustID API key configured." in result.stdout
-    assert "Operation cancelled." in result.stdout
-
-
-def test_identify_template_override(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
-    """Apply a custom output template passed on the CLI."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-    config_path = make_config(tmp_path)
-
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=100.0),
-    )
-
-    monkeypatch.setattr(
-        cli,
-        "lookup_recordings",
-        lambda *_args, **_kwargs: [
-            AcoustIDMatch(
-                score=0.5,
-                recording_id="rec",
-                title="Titre",
-                artist="Artiste",
-            )
-        ],
-    )
-
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
-    result = cli_runner.invoke(
-        cli.app,
-        [
-            "identify",
-            str(audio_path),
-            "--config-path",
-            str(config_path),
-            "--template",
-            "{artist} :: {title}",
-        ],
-    )
-
-    assert result.exit_code == 0
-    assert "Artiste :: Titre" in result.stdout
+    assert b"No AcoustID API key configured." in result.stdout_bytes
+    assert b"Operation cancelled." in result.stdout_bytes
 
 
 def test_identify_register_key_via_prompt(
-    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner, shared_audio: Path
 ) -> None:
     """Store a prompted API key and continue the identification flow."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
     config_path = tmp_path / "config.toml"
 
     def fake_compute(_audio_path, fpcalc_path=None):
@@ -739,61 +620,18 @@ def test_identify_register_key_via_prompt(
 
     monkeypatch.setattr(cli, "compute_fingerprint", fake_compute)
     monkeypatch.setattr(cli, "lookup_recordings", fake_lookup)
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(cli, "_configure_api_key_interactively", fake_configure)
 
     result = cli_runner.invoke(
         cli.app,
         [
             "identify",
-            str(audio_path),
-            "--config-path",
-            str(config_path),
-        ],
-        input="o\n",
-    )
-
-    assert result.exit_code == 0
-    assert "Result 1" in result.stdout
-
-
-def test_identify_respects_locale_env(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
-    """Switch to French locale when RECOZIK_LOCALE is set."""
-    audio_path = tmp_path / "song.wav"
-    audio_path.write_bytes(b"fake")
-
-    config_path = make_config(tmp_path)
-
-    monkeypatch.setattr(
-        cli,
-        "compute_fingerprint",
-        lambda *_args, **_kwargs: FingerprintResult(fingerprint="FP", duration_seconds=90.0),
-    )
-
-    monkeypatch.setattr(
-        cli,
-        "lookup_recordings",
-        lambda *_args, **_kwargs: [
-            AcoustIDMatch(
-                score=0.42,
-                recording_id="rec",
-                title="Titre",
-                artist="Artiste",
-            )
-        ],
-    )
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
-
-    result = cli_runner.invoke(
-        cli.app,
-        [
-            "identify",
-            str(audio_path),
+            str(shared_audio),
             "--config-path",
             str(config_path),
         ],
-        env={"RECOZIK_LOCALE": "fr_FR"},
+        input=_INPUT_YES,
     )
 
     assert result.exit_code == 0
-    assert "Résultat 1" in result.stdout
+    assert b"Result 1" in result.stdout_bytes
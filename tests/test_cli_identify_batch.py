@@ -2,23 +2,36 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+import typer
+from recozik_services.batch import BatchSummary
+from recozik_services.cli_support.audd_helpers import get_audd_support
 from typer.testing import CliRunner
 
 from recozik import audd, cli
 from recozik.fingerprint import AcoustIDMatch, FingerprintResult
 
-from .helpers.identify import DummyLookupCache, make_config
+from .helpers.identify import DummyAudDError, iter_jsonl, make_config
 
+_BATCH_DEFAULTS_TOML = """\
+[identify_batch]
+limit = 2
+best_only = true
+recursive = true
+log_file = "{log_file}"
+"""
 
-def _write_config(
-    tmp_path: Path,
-    template: str | None = None,
-    log_format: str = "text",
-) -> Path:
-    """Create a reusable configuration file tailored for batch tests."""
+pytestmark = pytest.mark.usefixtures("dummy_lookup_cache")
+
+
+@functools.cache
+def _batch_config_lines(template: str | None, log_format: str) -> tuple[str, ...]:
+    """Assemble the batch-specific config sections once per parameter combination."""
     sections: list[str] = [
         "[audd]",
         '# api_token = "token"',
@@ -33,7 +46,16 @@ def _write_config(
         sections.append(f'template = "{template}"')
     sections.append("")
     sections += ["[logging]", f'format = "{log_format}"', "absolute_paths = false", ""]
-    return make_config(tmp_path, extra_lines=sections)
+    return tuple(sections)
+
+
+def _write_config(
+    tmp_path: Path,
+    template: str | None = None,
+    log_format: str = "text",
+) -> Path:
+    """Create a reusable configuration file tailored for batch tests."""
+    return make_config(tmp_path, extra_lines=_batch_config_lines(template, log_format))
 
 
 def test_identify_batch_text_log(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
@@ -48,7 +70,6 @@ def test_identify_batch_text_log(monkeypatch, tmp_path: Path, cli_runner: CliRun
     config_path = _write_config(tmp_path)
     log_path = tmp_path / "result.log"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -87,10 +108,10 @@ def test_identify_batch_text_log(monkeypatch, tmp_path: Path, cli_runner: CliRun
     )
 
     assert result.exit_code == 0
-    contents = log_path.read_text(encoding="utf-8")
-    assert "file: track_a.mp3" in contents
-    assert "Artist - Track_A" in contents
-    assert "file: track_b.flac" in contents
+    contents = log_path.read_bytes()
+    assert b"file: track_a.mp3" in contents
+    assert b"Artist - Track_A" in contents
+    assert b"file: track_b.flac" in contents
 
 
 def test_identify_batch_json_log(monkeypatch, tmp_path: Path, cli_runner: CliRunner) -> None:
@@ -103,7 +124,6 @@ def test_identify_batch_json_log(monkeypatch, tmp_path: Path, cli_runner: CliRun
     config_path = _write_config(tmp_path, log_format="jsonl")
     log_path = tmp_path / "result.jsonl"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -140,13 +160,117 @@ def test_identify_batch_json_log(monkeypatch, tmp_path: Path, cli_runner: CliRun
     )
 
     assert result.exit_code == 0
-    lines = [line for line in log_path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(log_path)
     assert payload["path"] == "song.mp3"
     assert payload["matches"][0]["formatted"].startswith("Artist -")
 
 
+def test_identify_batch_workers_keep_log_order(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+) -> None:
+    """Log entries in file order even when several workers identify files concurrently."""
+    audio_dir = tmp_path / "music"
+    audio_dir.mkdir()
+    for name, size in (("a.mp3", 1), ("b.mp3", 64), ("c.mp3", 8)):
+        (audio_dir / name).write_bytes(b"x" * size)
+
+    config_path = _write_config(tmp_path, log_format="jsonl")
+    log_path = tmp_path / "result.jsonl"
+
+    monkeypatch.setattr(
+        cli,
+        "compute_fingerprint",
+        lambda path, fpcalc_path=None: FingerprintResult(
+            fingerprint=path.stem.upper(), duration_seconds=120.0
+        ),
+    )
+    monkeypatch.setattr(
+        cli,
+        "lookup_recordings",
+        lambda api_key, fingerprint_result, meta=None, timeout=None: [
+            AcoustIDMatch(
+                score=0.9,
+                recording_id=f"id-{fingerprint_result.fingerprint}",
+                title=fingerprint_result.fingerprint,
+                artist="Artist",
+            )
+        ],
+    )
+
+    result = cli_runner.invoke(
+        cli.app,
+        [
+            "identify-batch",
+            str(audio_dir),
+            "--config-path",
+            str(config_path),
+            "--log-file",
+            str(log_path),
+            "--log-format",
+            "jsonl",
+            "--workers",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    payloads = list(iter_jsonl(log_path))
+    assert [payload["path"] for payload in payloads] == ["a.mp3", "b.mp3", "c.mp3"]
+    assert [payload["matches"][0]["recording_id"] for payload in payloads] == [
+        "id-A",
+        "id-B",
+        "id-C",
+    ]
+
+
+def test_identify_batch_workers_echo_each_status_line_once(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+) -> None:
+    """Print every status line exactly once when worker threads report concurrently."""
+    audio_dir = tmp_path / "music"
+    audio_dir.mkdir()
+    (audio_dir / "track.mp3").write_bytes(b"x")
+    config_path = _write_config(tmp_path)
+    expected = [f"worker {worker} line {line}" for worker in range(4) for line in range(500)]
+
+    def fake_run_batch(request, *, callbacks, **_kwargs):
+        def report(worker: int) -> None:
+            for line in range(500):
+                callbacks.info(f"worker {worker} line {line}")
+
+        with ThreadPoolExecutor(max_workers=request.workers) as executor:
+            list(executor.map(report, range(4)))
+        return BatchSummary(success=0, unmatched=0, failures=0)
+
+    echo = typer.echo
+
+    def yielding_echo(*args, **kwargs) -> None:
+        # Give other workers the GIL mid-echo so an unguarded batcher would race.
+        time.sleep(0.001)
+        echo(*args, **kwargs)
+
+    monkeypatch.setattr("recozik.commands.identify_batch.run_batch_identify", fake_run_batch)
+    monkeypatch.setattr(typer, "echo", yielding_echo)
+
+    result = cli_runner.invoke(
+        cli.app,
+        [
+            "identify-batch",
+            str(audio_dir),
+            "--config-path",
+            str(config_path),
+            "--log-file",
+            str(tmp_path / "result.log"),
+            "--workers",
+            "4",
+        ],
+    )
+
+    assert result.exit_code == 0
+    lines = [line for line in result.stdout.splitlines() if line.startswith("worker ")]
+    assert sorted(lines) == sorted(expected)
+
+
 def test_identify_batch_metadata_fallback(
     monkeypatch, tmp_path: Path, cli_runner: CliRunner
 ) -> None:
@@ -159,7 +283,6 @@ def test_identify_batch_metadata_fallback(
     config_path = _write_config(tmp_path, log_format="jsonl")
     log_path = tmp_path / "fallback.jsonl"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -189,9 +312,7 @@ def test_identify_batch_metadata_fallback(
     assert result.exit_code == 0
     assert "embedded metadata recorded" in result.stdout
 
-    lines = [line for line in log_path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(log_path)
     assert payload["metadata"]["artist"] == "Tag Artist"
     assert payload["metadata"]["title"] == "Tag Title"
 
@@ -209,22 +330,8 @@ def test_identify_batch_respects_config_defaults(
 
     config_log = tmp_path / "config-log.jsonl"
     config_path = _write_config(tmp_path, log_format="jsonl")
-    config_path.write_text(
-        config_path.read_text(encoding="utf-8")
-        + "\n".join(
-            [
-                "[identify_batch]",
-                "limit = 2",
-                "best_only = true",
-                "recursive = true",
-                f'log_file = "{config_log}"',
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
+    with config_path.open("a", encoding="utf-8") as handle:
+        handle.write(_BATCH_DEFAULTS_TOML.format(log_file=config_log))
 
     monkeypatch.setattr(
         cli,
@@ -268,9 +375,7 @@ def test_identify_batch_respects_config_defaults(
 
     assert result.exit_code == 0
     assert config_log.exists()
-    lines = [line for line in config_log.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(config_log)
     assert payload["path"].endswith("nested/track.mp3")
     assert len(payload["matches"]) == 1
     assert payload["matches"][0]["recording_id"].endswith("-1")
@@ -285,12 +390,11 @@ def test_identify_batch_extension_filter(
     keep_file = audio_dir / "keep.wav"
     skip_file = audio_dir / "skip.txt"
     keep_file.write_bytes(b"a")
-    skip_file.write_text("ignore", encoding="utf-8")
+    skip_file.write_bytes(b"ignore")
 
     config_path = _write_config(tmp_path)
     log_path = tmp_path / "filter.log"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -325,9 +429,9 @@ def test_identify_batch_extension_filter(
 
     assert result.exit_code == 0
 
-    contents = log_path.read_text(encoding="utf-8")
-    assert "keep.wav" in contents
-    assert "skip.txt" not in contents
+    contents = log_path.read_bytes()
+    assert b"keep.wav" in contents
+    assert b"skip.txt" not in contents
 
 
 def test_identify_batch_uses_audd_fallback(
@@ -342,7 +446,6 @@ def test_identify_batch_uses_audd_fallback(
     config_path = _write_config(tmp_path, log_format="jsonl")
     log_path = tmp_path / "fallback.jsonl"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -357,9 +460,6 @@ def test_identify_batch_uses_audd_fallback(
         artist="Fallback Artist",
     )
 
-    class DummyAudDError(Exception):
-        pass
-
     monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
     monkeypatch.setattr(audd, "recognize_with_audd", lambda *_args, **_kwargs: [fake_match])
 
@@ -380,15 +480,66 @@ def test_identify_batch_uses_audd_fallback(
     )
 
     assert result.exit_code == 0
-    lines = [line for line in log_path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(log_path)
     assert payload["note"] == "Source: AudD."
     assert payload["matches"][0]["recording_id"] == "audd-batch"
     assert "AudD identified needs-fallback.mp3." in result.stdout
     assert "Identification strategy: AcoustID first, AudD fallback." in result.stderr
 
 
+def test_identify_batch_workers_keep_audd_lines_in_order(
+    monkeypatch, tmp_path: Path, cli_runner: CliRunner
+) -> None:
+    """Report AudD results in file order and each failure once when workers run in parallel."""
+    audio_dir = tmp_path / "music"
+    audio_dir.mkdir()
+    for name in ("a.mp3", "b.mp3", "c.mp3", "d.mp3"):
+        (audio_dir / name).write_bytes(name.encode())
+    config_path = _write_config(tmp_path)
+
+    monkeypatch.setattr(
+        cli,
+        "compute_fingerprint",
+        lambda *_args, **_kwargs: FingerprintResult(fingerprint="MISS", duration_seconds=180.0),
+    )
+    monkeypatch.setattr(cli, "lookup_recordings", lambda *_args, **_kwargs: [])
+
+    def fake_recognize(_token, path, **_kwargs):
+        if path.name in {"b.mp3", "d.mp3"}:
+            raise DummyAudDError(f"quota exceeded for {path.stem}")
+        return [AcoustIDMatch(score=0.9, recording_id=path.stem, title="T", artist="A")]
+
+    monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
+    monkeypatch.setattr(audd, "recognize_with_audd", fake_recognize)
+    # The AudD helpers memoize the error class; rebuild them around the stub.
+    get_audd_support.cache_clear()
+
+    result = cli_runner.invoke(
+        cli.app,
+        [
+            "identify-batch",
+            str(audio_dir),
+            "--config-path",
+            str(config_path),
+            "--log-file",
+            str(tmp_path / "result.log"),
+            "--audd-token",
+            "secret",
+            "--workers",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    identified = [line for line in result.stdout.splitlines() if line.startswith("AudD ")]
+    assert list(dict.fromkeys(identified)) == ["AudD identified a.mp3.", "AudD identified c.mp3."]
+    failures = [line for line in result.stderr.splitlines() if "AudD lookup failed" in line]
+    assert sorted(failures) == [
+        "AudD lookup failed: quota exceeded for b.",
+        "AudD lookup failed: quota exceeded for d.",
+    ]
+
+
 def test_identify_batch_can_disable_audd(
     monkeypatch, tmp_path: Path, cli_runner: CliRunner
 ) -> None:
@@ -401,7 +552,6 @@ def test_identify_batch_can_disable_audd(
     config_path = _write_config(tmp_path, log_format="jsonl")
     log_path = tmp_path / "no_audd.jsonl"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -433,9 +583,7 @@ def test_identify_batch_can_disable_audd(
     )
 
     assert result.exit_code == 0
-    lines = [line for line in log_path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(log_path)
     assert payload["note"] == "No match."
     assert "AudD fallback identified" not in result.stdout
     assert "AcoustID only (AudD disabled)." in result.stderr
@@ -451,7 +599,6 @@ def test_identify_batch_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: Cli
     config_path = _write_config(tmp_path, log_format="jsonl")
     log_path = tmp_path / "priority.jsonl"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -470,9 +617,6 @@ def test_identify_batch_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: Cli
         artist="AudD Artist",
     )
 
-    class DummyAudDError(Exception):
-        pass
-
     monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
     monkeypatch.setattr(audd, "recognize_with_audd", lambda *_args, **_kwargs: [fake_match])
 
@@ -494,9 +638,7 @@ def test_identify_batch_prefer_audd(monkeypatch, tmp_path: Path, cli_runner: Cli
     )
 
     assert result.exit_code == 0
-    lines = [line for line in log_path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(log_path)
     assert payload["note"] == "Source: AudD."
     assert payload["matches"][0]["recording_id"] == "audd-priority"
     assert "Identification strategy: AudD first, AcoustID fallback." in result.stderr
@@ -512,7 +654,6 @@ def test_identify_batch_silent_source(monkeypatch, tmp_path: Path, cli_runner: C
     config_path = _write_config(tmp_path, log_format="jsonl")
     log_path = tmp_path / "silent.jsonl"
 
-    monkeypatch.setattr(cli, "LookupCache", DummyLookupCache)
     monkeypatch.setattr(
         cli,
         "compute_fingerprint",
@@ -527,9 +668,6 @@ def test_identify_batch_silent_source(monkeypatch, tmp_path: Path, cli_runner: C
         artist="AudD Artist",
     )
 
-    class DummyAudDError(Exception):
-        pass
-
     monkeypatch.setattr(audd, "AudDLookupError", DummyAudDError)
     monkeypatch.setattr(audd, "recognize_with_audd", lambda *_args, **_kwargs: [fake_match])
 
@@ -551,8 +689,6 @@ def test_identify_batch_silent_source(monkeypatch, tmp_path: Path, cli_runner: C
     )
 
     assert result.exit_code == 0
-    lines = [line for line in log_path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
-    payload = json.loads(lines[0])
+    (payload,) = iter_jsonl(log_path)
     assert payload["matches"][0]["recording_id"] == "audd-silent"
     assert "Identification strategy" not in result.stderr
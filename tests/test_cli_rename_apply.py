@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 
 import pytest
 from typer.testing import CliRunner
@@ -150,8 +151,7 @@ def test_rename_from_log_log_cleanup_modes(
 def test_rename_from_log_conflict_append(cli_runner: CliRunner, rename_env: RenameTestEnv) -> None:
     """Append a numeric suffix when the target filename already exists."""
     root = rename_env.make_root("music")
-    rename_env.create_source(root, "song1.mp3", data=b"a")
-    rename_env.create_source(root, "song2.mp3", data=b"b")
+    rename_env.create_sources(root, {"song1.mp3": b"a", "song2.mp3": b"b"})
 
     log_path = rename_env.write_log(
         "conflict.jsonl",
@@ -187,14 +187,14 @@ def test_rename_from_log_conflict_append(cli_runner: CliRunner, rename_env: Rena
     )
 
     assert result.exit_code == 0
-    files = {p.name for p in root.glob("*.mp3")}
+    files = {name for name in os.listdir(root) if name.endswith(".mp3")}
     assert files == {"Artist - Same.mp3", "Artist - Same-1.mp3"}
 
 
 def test_rename_from_log_invalid_format(cli_runner: CliRunner, rename_env: RenameTestEnv) -> None:
     """Abort when the provided log file is not JSONL."""
     log_path = rename_env.base / "plain.log"
-    log_path.write_text("file: track.mp3\n", encoding="utf-8")
+    log_path.write_bytes(b"file: track.mp3\n")
 
     result = invoke_rename(
         cli_runner,
@@ -244,9 +244,9 @@ def test_rename_from_log_export(cli_runner: CliRunner, rename_env: RenameTestEnv
     assert result.exit_code == 0
     assert not src.exists()
     assert export_file.exists()
-    payload = json.loads(export_file.read_text(encoding="utf-8"))
+    payload = json.loads(export_file.read_bytes())
     assert payload[0]["applied"] is True
-    assert payload[0]["target"].endswith("Artist - Export.mp3")
+    assert payload[0]["target"] == str(root / "Artist - Export.mp3")
 
 
 def test_rename_from_log_respects_config_default_mode(
@@ -371,9 +371,9 @@ def test_rename_from_log_conflict_strategy_via_config(
 ) -> None:
     """Skip renames when the config requests the skip conflict strategy."""
     root = rename_env.make_root("config-conflict")
-    existing = root / "Artist - Conflict.flac"
-    existing.write_bytes(b"existing")
-    src = rename_env.create_source(root, "source.flac")
+    existing, src = rename_env.create_sources(
+        root, {"Artist - Conflict.flac": b"existing", "source.flac": b"data"}
+    )
 
     log_path = rename_env.write_log(
         "config-conflict.jsonl",
@@ -14,151 +14,82 @@ from .conftest import RenameTestEnv
 from .helpers.rename import build_matches, build_rename_command, invoke_rename, make_entry
 
 
-def test_rename_from_log_interactive_interrupt_cancel(
-    monkeypatch, cli_runner: CliRunner, rename_env: RenameTestEnv
-) -> None:
-    """Cancel the command after Ctrl+C during selection."""
-    root = rename_env.make_root("interrupt-cancel")
-    src = rename_env.create_source(root, "track.mp3")
-
-    log_path = rename_env.write_log(
-        "interrupt-cancel.jsonl",
-        [
-            make_entry(
-                "track.mp3",
-                matches=build_matches(
-                    [
-                        ("Pick Me", 0.9, "1"),
-                        ("Other Option", 0.8, "2"),
-                    ]
-                ),
-            )
-        ],
-    )
-
-    responses: list[object] = [typer.Abort(), "1"]
+def _queue_prompt_responses(monkeypatch, responses: list[object]) -> None:
+    """Answer ``typer.prompt`` calls from ``responses``, raising queued exceptions."""
+    queue = list(responses)
 
     def fake_prompt(*args, **kwargs):
-        if not responses:
+        if not queue:
             raise AssertionError("Unexpected prompt call")
-        value = responses.pop(0)
+        value = queue.pop(0)
         if isinstance(value, Exception):
             raise value
         return value
 
     monkeypatch.setattr(cli.typer, "prompt", fake_prompt)
 
-    result = invoke_rename(
-        cli_runner,
-        build_rename_command(
-            log_path,
-            root,
-            interactive=True,
-            apply=True,
-            log_cleanup="never",
-        ),
-    )
-
-    assert result.exit_code == 1
-    assert "Operation cancelled; no files renamed." in result.stdout
-    assert src.exists()
-
-
-def test_rename_from_log_interactive_interrupt_apply(
-    monkeypatch, cli_runner: CliRunner, rename_env: RenameTestEnv
-) -> None:
-    """Apply partial renames after Ctrl+C."""
-    root = rename_env.make_root("interrupt-apply")
-    first = rename_env.create_source(root, "first.mp3")
-    second = rename_env.create_source(root, "second.mp3")
 
-    log_path = rename_env.write_log(
-        "interrupt-apply.jsonl",
-        [
-            make_entry(
-                "first.mp3",
-                matches=build_matches(
-                    [
-                        ("A", 0.9, "1"),
-                        ("B", 0.8, "2"),
-                    ]
-                ),
-            ),
-            make_entry(
-                "second.mp3",
-                matches=build_matches(
-                    [
-                        ("C", 0.95, "3"),
-                        ("D", 0.6, "4"),
-                    ]
-                ),
-            ),
-        ],
-    )
-
-    responses: list[object] = ["1", typer.Abort(), "2"]
-
-    def fake_prompt(*args, **kwargs):
-        if not responses:
-            raise AssertionError("Unexpected prompt call")
-        value = responses.pop(0)
-        if isinstance(value, Exception):
-            raise value
-        return value
-
-    monkeypatch.setattr(cli.typer, "prompt", fake_prompt)
-
-    result = invoke_rename(
-        cli_runner,
-        build_rename_command(
-            log_path,
-            root,
-            interactive=True,
-            apply=True,
-            log_cleanup="never",
+@pytest.mark.parametrize(
+    ("case_name", "sources", "responses", "expected_exit", "expected_message", "renamed"),
+    [
+        pytest.param(
+            "interrupt-cancel",
+            {"track.mp3": [("Pick Me", 0.9, "1"), ("Other Option", 0.8, "2")]},
+            [typer.Abort(), "1"],
+            1,
+            "Operation cancelled; no files renamed.",
+            {"track.mp3": None},
+            id="cancel",
         ),
-    )
-
-    assert result.exit_code == 0
-    assert "Continuing with renames confirmed before the interruption." in result.stdout
-    assert not first.exists()
-    assert (root / "Artist - A.mp3").exists()
-    assert second.exists()
-
-
-def test_rename_from_log_interactive_interrupt_resume(
-    monkeypatch, cli_runner: CliRunner, rename_env: RenameTestEnv
+        pytest.param(
+            "interrupt-apply",
+            {
+                "first.mp3": [("A", 0.9, "1"), ("B", 0.8, "2")],
+                "second.mp3": [("C", 0.95, "3"), ("D", 0.6, "4")],
+            },
+            ["1", typer.Abort(), "2"],
+            0,
+            "Continuing with renames confirmed before the interruption.",
+            {"first.mp3": "A", "second.mp3": None},
+            id="apply",
+        ),
+        pytest.param(
+            "interrupt-resume",
+            {"resume.mp3": [("Resume", 0.9, "1"), ("Continue", 0.8, "2")]},
+            [typer.Abort(), "3", "2"],
+            0,
+            "Resume the current question",
+            {"resume.mp3": "Continue"},
+            id="resume",
+        ),
+    ],
+)
+def test_rename_from_log_interactive_interrupt(
+    monkeypatch,
+    cli_runner: CliRunner,
+    rename_env: RenameTestEnv,
+    case_name: str,
+    sources: dict[str, list[tuple[str, float, str]]],
+    responses: list[object],
+    expected_exit: int,
+    expected_message: str,
+    renamed: dict[str, str | None],
 ) -> None:
-    """Resume questioning after the user requests it."""
-    root = rename_env.make_root("interrupt-resume")
-    src = rename_env.create_source(root, "resume.mp3")
+    """Cancel, apply confirmed renames, or resume after Ctrl+C during selection."""
+    root = rename_env.make_root(case_name)
+    source_paths = dict(
+        zip(sources, rename_env.create_sources(root, dict.fromkeys(sources, b"data")), strict=True)
+    )
 
     log_path = rename_env.write_log(
-        "interrupt-resume.jsonl",
+        f"{case_name}.jsonl",
         [
-            make_entry(
-                "resume.mp3",
-                matches=build_matches(
-                    [
-                        ("Resume", 0.9, "1"),
-                        ("Continue", 0.8, "2"),
-                    ]
-                ),
-            )
+            make_entry(filename, matches=build_matches(matches))
+            for filename, matches in sources.items()
         ],
     )
 
-    responses: list[object] = [typer.Abort(), "3", "2"]
-
-    def fake_prompt(*args, **kwargs):
-        if not responses:
-            raise AssertionError("Unexpected prompt call")
-        value = responses.pop(0)
-        if isinstance(value, Exception):
-            raise value
-        return value
-
-    monkeypatch.setattr(cli.typer, "prompt", fake_prompt)
+    _queue_prompt_responses(monkeypatch, responses)
 
     result = invoke_rename(
         cli_runner,
@@ -171,10 +102,12 @@ def test_rename_from_log_interactive_interrupt_resume(
         ),
     )
 
-    assert result.exit_code == 0
-    assert "Resume the current question" in result.stdout
-    assert not src.exists()
-    assert (root / "Artist - Continue.mp3").exists()
+    assert result.exit_code == expected_exit
+    assert expected_message in result.stdout
+    for filename, title in renamed.items():
+        assert source_paths[filename].exists() is (title is None)
+        if title is not None:
+            assert (root / f"Artist - {title}.mp3").exists()
 
 
 @pytest.mark.parametrize(
@@ -243,18 +176,8 @@ def test_rename_from_log_rename_interrupt_behaviour(
         ],
     )
 
-    response_queue: list[object] = list(responses)
-
-    def fake_prompt(*args, **kwargs):
-        if not response_queue:
-            raise AssertionError("Unexpected prompt call")
-        value = response_queue.pop(0)
-        if isinstance(value, Exception):
-            raise value
-        return value
-
     original_prompt = cli.typer.prompt
-    monkeypatch.setattr(cli.typer, "prompt", fake_prompt)
+    _queue_prompt_responses(monkeypatch, list(responses))
 
     original_rename = Path.rename
     call_count = {"value": 0}
@@ -63,7 +63,7 @@ def test_cli_identify_uses_service_layer(
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = json.loads(result.stdout_bytes)
     assert payload[0]["recording_id"] == "rec-1"
     assert captured_request["request"].audio_path == audio_path
 
@@ -121,8 +121,7 @@ def test_cli_identify_batch_uses_service_layer(
 
     assert result.exit_code == 0
     assert log_path.exists()
-    log_contents = log_path.read_text(encoding="utf-8")
-    assert "Track" in log_contents
+    assert b"Track" in log_path.read_bytes()
     assert Path(next(iter(captured_request["request"].files))).name in {"a.wav", "b.wav"}
 
 
@@ -0,0 +1,33 @@
+"""Tests for the log template helpers."""
+
+from __future__ import annotations
+
+import pytest
+from recozik_services.cli_support import logs
+
+_CONTEXT = {"artist": "Artist", "title": "Title", "score": "0.87", "album": ""}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        pytest.param("{artist} - {title}", id="plain"),
+        pytest.param("{title:>8}|{score:.3}|{artist:^10}", id="format-spec"),
+        pytest.param("{artist!r} / {title!s} / {artist!a}", id="conversion"),
+        pytest.param("{artist!r:>12}", id="conversion-with-spec"),
+        pytest.param("{{literal}} {artist} }}{{", id="escaped-braces"),
+        pytest.param("{artist} [{missing}] {missing:>3}", id="missing-key"),
+        pytest.param("{album}{title}", id="empty-value"),
+        pytest.param("{title:>{width}}", id="nested-spec-fallback"),
+        pytest.param("{artist[0]}{title[1]}", id="item-access-fallback"),
+        pytest.param("no fields", id="no-fields"),
+        pytest.param("", id="empty"),
+    ],
+)
+def test_render_template_matches_str_format(template: str) -> None:
+    """Render templates exactly like ``str.format_map`` with missing fields left empty."""
+    context = {**_CONTEXT, "width": "6"}
+
+    expected = template.format_map(logs._SafeDict(context))
+
+    assert logs._render_template(template, context) == expected
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from recozik.config import AppConfig, backup_config_file, load_config, write_config
 from recozik_core import secrets as secret_store
 
@@ -225,3 +227,13 @@ def test_backup_config_file_creates_copy(tmp_path: Path) -> None:
     assert backup is not None
     assert backup.exists()
     assert backup.read_text(encoding="utf-8") == "content"
+
+
+@pytest.mark.parametrize("workers", ["0", "17", "200", "true", "2.5", '"4"'])
+def test_load_config_rejects_invalid_batch_workers(tmp_path: Path, workers: str) -> None:
+    """Reject worker counts that are not integers within the --workers bounds."""
+    target = tmp_path / "config.toml"
+    target.write_text(f"[identify_batch]\nworkers = {workers}\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match=r"identify_batch\.workers"):
+        load_config(target)
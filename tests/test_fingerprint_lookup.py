@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 from recozik.fingerprint import (
     AcoustIDLookupError,
+    FingerprintError,
     FingerprintResult,
     ReleaseInfo,
+    _normalize_fingerprint_output,
+    compute_fingerprint,
     lookup_recordings,
 )
 
@@ -70,6 +77,93 @@ def test_lookup_recordings_parses_response(monkeypatch) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("raw_first", "raw_second", "expected_duration"),
+    [
+        (95.3, b"FP", 95.3),
+        (b"FP", 95.3, 95.3),
+        (95, "FP", 95.0),
+        ("FP", "95.3", 95.3),
+    ],
+)
+def test_normalize_fingerprint_output_orderings(
+    raw_first: object, raw_second: object, expected_duration: float
+) -> None:
+    """Accept both ``(duration, fingerprint)`` and ``(fingerprint, duration)`` layouts."""
+    fingerprint, duration = _normalize_fingerprint_output(raw_first, raw_second)
+
+    assert fingerprint == "FP"
+    assert duration == pytest.approx(expected_duration)
+
+
+def test_normalize_fingerprint_output_rejects_missing_duration() -> None:
+    """Raise when neither element can be interpreted as a duration."""
+    with pytest.raises(FingerprintError):
+        _normalize_fingerprint_output(b"FP", b"not-a-number")
+
+
+def test_compute_fingerprint_restores_fpcalc_override_across_threads(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Keep the fpcalc override visible to concurrent calls and restore it afterwards."""
+    monkeypatch.delenv("FPCALC", raising=False)
+    audio_path = tmp_path / "song.wav"
+    audio_path.write_bytes(b"fake")
+    barrier = threading.Barrier(2)
+    seen: list[str | None] = []
+
+    def fake_fingerprint_file(path: str, force_fpcalc: bool = False) -> tuple[float, bytes]:
+        barrier.wait(timeout=5)
+        seen.append(os.environ.get("FPCALC"))
+        barrier.wait(timeout=5)
+        return 95.3, b"FP"
+
+    monkeypatch.setattr("recozik.fingerprint.pyacoustid.fingerprint_file", fake_fingerprint_file)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(
+                lambda _index: compute_fingerprint(audio_path, fpcalc_path=Path("/opt/fpcalc")),
+                range(2),
+            )
+        )
+
+    assert [result.fingerprint for result in results] == ["FP", "FP"]
+    assert seen == ["/opt/fpcalc", "/opt/fpcalc"]
+    assert "FPCALC" not in os.environ
+
+
+def test_compute_fingerprint_rejects_conflicting_fpcalc_override(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Refuse to switch the fpcalc override while another thread still relies on it."""
+    monkeypatch.delenv("FPCALC", raising=False)
+    audio_path = tmp_path / "song.wav"
+    audio_path.write_bytes(b"fake")
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_fingerprint_file(path: str, force_fpcalc: bool = False) -> tuple[float, bytes]:
+        started.set()
+        release.wait(timeout=5)
+        return 95.3, b"FP"
+
+    monkeypatch.setattr("recozik.fingerprint.pyacoustid.fingerprint_file", fake_fingerprint_file)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(compute_fingerprint, audio_path, fpcalc_path=Path("/opt/fpcalc"))
+        assert started.wait(timeout=5)
+        try:
+            with pytest.raises(FingerprintError, match="/opt/other"):
+                compute_fingerprint(audio_path, fpcalc_path=Path("/opt/other"))
+            assert os.environ.get("FPCALC") == "/opt/fpcalc"
+        finally:
+            release.set()
+        assert pending.result().fingerprint == "FP"
+
+    assert "FPCALC" not in os.environ
+
+
 def test_lookup_recordings_requires_api_key() -> None:
     """Require an API key before performing a lookup."""
     with pytest.raises(AcoustIDLookupError):
@@ -0,0 +1,40 @@
+"""Tests for the orjson-backed JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from recozik_core import json_codec
+
+
+def test_json_loads_accepts_standard_library_extensions() -> None:
+    """Decode payloads orjson rejects (such as NaN) through the stdlib parser."""
+    payload = json_codec.loads(b'{"score": NaN, "id": "x"}')
+
+    assert payload["id"] == "x"
+    assert payload["score"] != payload["score"]
+
+
+def test_json_dumps_round_trips_non_ascii_text() -> None:
+    """Encode compact JSON that keeps non-ASCII characters readable."""
+    payload = {"title": "Café", "score": 0.5, "big": 2**70}
+
+    encoded = json_codec.dumps(payload)
+
+    assert "Café" in encoded
+    assert json_codec.loads(encoded) == payload
+
+
+def test_json_dumps_fallback_keeps_standard_separators(monkeypatch) -> None:
+    """Leave the stdlib output format unchanged when orjson is not installed."""
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert json_codec.dumps({"title": "Café", "score": 1}) == '{"title": "Café", "score": 1}'
+
+
+def test_json_loads_raises_standard_decode_error() -> None:
+    """Report malformed input as ``json.JSONDecodeError`` regardless of backend."""
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
@@ -1,6 +1,5 @@
 """Service-layer unit tests for Recozik."""
 
-import json
 from dataclasses import replace
 from pathlib import Path
 
@@ -17,9 +16,22 @@ from recozik_services.identify import (
 from recozik_services.rename import RenamePrompts, RenameRequest, rename_from_log
 from recozik_services.security import AccessDeniedError, QuotaScope
 
+from recozik_core import musicbrainz
 from recozik_core.audd import AudDEnterpriseParams, AudDMode
 from recozik_core.fingerprint import AcoustIDMatch, FingerprintResult, ReleaseInfo
 
+from .helpers.rename import make_entry, make_match, write_jsonl_log
+
+
+def _write_song_log(tmp_path: Path, path: str) -> Path:
+    """Write a one-entry rename log matching ``path`` to "Artist - Song"."""
+    entry = make_entry(
+        path,
+        status="ok",
+        matches=[make_match(artist="Artist", title="Song", formatted="Artist - Song.flac")],
+    )
+    return write_jsonl_log(tmp_path / "log.jsonl", [entry])
+
 
 class DummyPrompts(RenamePrompts):
     """Prompt stub returning static answers for rename tests."""
@@ -425,6 +437,26 @@ def test_batch_service_best_only_and_metadata(tmp_path):
     assert meta_entry.metadata and meta_entry.metadata["artist"] == "Meta"
 
 
+def test_musicbrainz_clients_share_one_rate_limit(monkeypatch):
+    """Space requests from separate clients, as identify-batch workers each build one."""
+    clock = [1000.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(musicbrainz.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(musicbrainz.time, "sleep", fake_sleep)
+    monkeypatch.setattr(musicbrainz, "_last_request", 0.0)
+    settings = musicbrainz.MusicBrainzSettings(rate_limit_per_second=2.0)
+
+    musicbrainz.MusicBrainzClient(settings)._respect_rate_limit()
+    musicbrainz.MusicBrainzClient(settings)._respect_rate_limit()
+
+    assert sleeps == [0.5]
+
+
 def test_rename_service_applies_changes(tmp_path):
     """Rename service should move files and emit an export summary."""
     root = tmp_path / "music"
@@ -432,20 +464,7 @@ def test_rename_service_applies_changes(tmp_path):
     audio = root / "track.flac"
     audio.write_bytes(b"data")
 
-    log_file = tmp_path / "log.jsonl"
-    log_entry = {
-        "path": "track.flac",
-        "status": "ok",
-        "matches": [
-            {
-                "artist": "Artist",
-                "title": "Song",
-                "score": 0.9,
-                "formatted": "Artist - Song.flac",
-            }
-        ],
-    }
-    log_file.write_text(json.dumps(log_entry) + "\n", encoding="utf-8")
+    log_file = _write_song_log(tmp_path, "track.flac")
 
     request = RenameRequest(
         log_path=log_file,
@@ -477,20 +496,7 @@ def test_rename_service_dry_run_plan_reuse(tmp_path):
     audio = root / "track.flac"
     audio.write_bytes(b"data")
 
-    log_file = tmp_path / "log.jsonl"
-    log_entry = {
-        "path": "track.flac",
-        "status": "ok",
-        "matches": [
-            {
-                "artist": "Artist",
-                "title": "Song",
-                "score": 0.9,
-                "formatted": "Artist - Song.flac",
-            }
-        ],
-    }
-    log_file.write_text(json.dumps(log_entry) + "\n", encoding="utf-8")
+    log_file = _write_song_log(tmp_path, "track.flac")
 
     request = RenameRequest(
         log_path=log_file,
@@ -528,20 +534,7 @@ def test_rename_service_rejects_outside_root(tmp_path):
     outside = tmp_path / "other.flac"
     outside.write_bytes(b"data")
 
-    log_file = tmp_path / "log.jsonl"
-    log_entry = {
-        "path": str(outside),
-        "status": "ok",
-        "matches": [
-            {
-                "artist": "Artist",
-                "title": "Song",
-                "score": 0.9,
-                "formatted": "Artist - Song.flac",
-            }
-        ],
-    }
-    log_file.write_text(json.dumps(log_entry) + "\n", encoding="utf-8")
+    log_file = _write_song_log(tmp_path, str(outside))
 
     request = RenameRequest(
         log_path=log_file,
@@ -587,6 +580,50 @@ def test_discover_audio_files_skips_symlinks(tmp_path):
     assert files == [real.resolve()]
 
 
+def test_discover_audio_files_recurses_without_following_symlinks(tmp_path):
+    """Recursive discovery should descend into subdirectories but not symlinked ones."""
+    root = tmp_path / "music"
+    nested = root / "album" / "disc1"
+    nested.mkdir(parents=True)
+    track = nested / "track.FLAC"
+    track.write_bytes(b"data")
+    (nested / "cover.jpg").write_bytes(b"jpg")
+    (root / "loop").symlink_to(root / "album", target_is_directory=True)
+
+    files = list(
+        discover_audio_files(
+            root,
+            recursive=True,
+            patterns=[],
+            extensions={".flac"},
+        )
+    )
+
+    assert files == [track.resolve()]
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+@pytest.mark.parametrize("patterns", [[], ["*"]])
+def test_discover_audio_files_skips_bare_extension_dotfiles(tmp_path, recursive, patterns):
+    """A dotfile named exactly like an extension has no extension and is not selected."""
+    root = tmp_path / "music"
+    root.mkdir()
+    track = root / "track.mp3"
+    track.write_bytes(b"data")
+    (root / ".mp3").write_bytes(b"data")
+
+    files = list(
+        discover_audio_files(
+            root,
+            recursive=recursive,
+            patterns=patterns,
+            extensions={".mp3"},
+        )
+    )
+
+    assert files == [track.resolve()]
+
+
 def test_rename_service_creates_backup(tmp_path):
     """Backups should be written when a directory is provided."""
     root = tmp_path / "music"
@@ -594,20 +631,7 @@ def test_rename_service_creates_backup(tmp_path):
     audio = root / "track.flac"
     audio.write_bytes(b"data")
 
-    log_file = tmp_path / "log.jsonl"
-    log_entry = {
-        "path": "track.flac",
-        "status": "ok",
-        "matches": [
-            {
-                "artist": "Artist",
-                "title": "Song",
-                "score": 0.9,
-                "formatted": "Artist - Song.flac",
-            }
-        ],
-    }
-    log_file.write_text(json.dumps(log_entry) + "\n", encoding="utf-8")
+    log_file = _write_song_log(tmp_path, "track.flac")
 
     backup_dir = tmp_path / "backup"
 